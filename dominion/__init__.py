@@ -2,10 +2,16 @@ from .cards import *
 from .deck import Deck
 from .game import Game
 from .player import Human, Player
+from .rules import BuyRule, RuleBot
+
+# Registers every built-in card up front, in a fixed order, so card ids are stable.
+from .cards.expansions import first_edition, second_edition  # isort: skip
 
 __all__ = (
     "Game",
     "Player",
+    "RuleBot",
+    "BuyRule",
     "Card",
     "CardTypes",
     "Treasure",
@@ -0,0 +1,279 @@
+"""
+Vectorized statistics over the results of many games.
+
+`Results` flattens games into entries, one per player per game, each a position
+in a handful of NumPy arrays. Questions are answered with boolean masks over the
+entries and per-entry keys to group them by, never by looping over games:
+
+    results = Results.from_store(ResultStore("runs/smithy"))
+    holds_smithy = results.deck_count(Smithy) > 0
+    # Win rate of Smithy holders, with and without Witch in the kingdom.
+    group_by(results.in_kingdom(Witch)[holds_smithy], results.share[holds_smithy])
+    # Mean margin over the best opponent by game length.
+    group_by(results.turns, results.margin)
+    # How much each kingdom card changes BigMoney's win rate.
+    card_effects(results, results.share, results.bot == results.bot_id(BigMoney))
+
+Requires the optional `numpy` dependency (`pip install pydominion[batch]`).
+"""
+import typing as t
+
+import numpy as np
+
+from dominion.cards.card import Card
+from dominion.cards.registry import registry
+from dominion.player import Player
+from dominion.report import GameSummary
+from dominion.store import NO_ID, CardIds, ResultStore, encode, qualified_name
+
+# The normal quantile of a two-sided 95% confidence interval.
+Z_95 = 1.959964
+
+Keys = t.Union[np.ndarray, t.Sequence[np.ndarray]]
+
+
+def wilson_interval(
+    rate: np.ndarray, count: np.ndarray, z: float = Z_95
+) -> t.Tuple[np.ndarray, np.ndarray]:
+    """
+    The Wilson score interval of win rates `rate` over `count` games each.
+
+    Unlike the normal approximation it stays within [0, 1] and is usable for
+    rates near 0 or 1 and for small counts.
+    """
+    rate = np.asarray(rate, dtype=float)
+    count = np.maximum(np.asarray(count, dtype=float), 1)
+    spread = z * z / count
+    center = (rate + spread / 2) / (1 + spread)
+    half_width = (
+        z * np.sqrt(rate * (1 - rate) / count + spread / (4 * count)) / (1 + spread)
+    )
+    return center - half_width, center + half_width
+
+
+class Groups:
+    """Count, mean and variance of values for each distinct key, sorted by key."""
+
+    keys: np.ndarray
+    count: np.ndarray
+    mean: np.ndarray
+    variance: np.ndarray
+
+    def __init__(self, keys: Keys, values: np.ndarray) -> None:
+        if not isinstance(keys, np.ndarray):
+            keys = np.column_stack(keys)
+        values = np.asarray(values, dtype=float)
+        if keys.ndim == 1:
+            self.keys, inverse = np.unique(keys, return_inverse=True)
+        else:
+            self.keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        size = len(self.keys)
+        self.count = np.bincount(inverse, minlength=size)
+        self.mean = np.bincount(inverse, weights=values, minlength=size) / np.maximum(
+            self.count, 1
+        )
+        deviations = (values - self.mean[inverse]) ** 2
+        self.variance = np.bincount(
+            inverse, weights=deviations, minlength=size
+        ) / np.maximum(self.count - 1, 1)
+
+    @property
+    def standard_error(self) -> np.ndarray:
+        return np.sqrt(self.variance / np.maximum(self.count, 1))
+
+    def wilson_interval(self, z: float = Z_95) -> t.Tuple[np.ndarray, np.ndarray]:
+        """Confidence intervals of the means, when the values are win shares."""
+        return wilson_interval(self.mean, self.count, z)
+
+    def view(self) -> str:
+        return "\n".join(
+            f"{key}: {mean:.4g} ± {error:.2g} (n={count})"
+            for key, mean, error, count in zip(
+                self.keys.tolist(), self.mean, self.standard_error, self.count
+            )
+        )
+
+    def __str__(self) -> str:
+        return self.view()
+
+
+def group_by(keys: Keys, values: np.ndarray) -> Groups:
+    """
+    Groups `values` by `keys`, an array with a key per value, or a sequence of
+    such arrays to group by every combination of them.
+    """
+    return Groups(keys, values)
+
+
+def win_rate(shares: np.ndarray, z: float = Z_95) -> t.Tuple[float, float, float]:
+    """The mean of win `shares` and its Wilson confidence interval."""
+    rate = float(np.mean(shares)) if len(shares) else 0.0
+    low, high = wilson_interval(np.array(rate), np.array(len(shares)), z)
+    return rate, float(low), float(high)
+
+
+class CardEffects:
+    """
+    How the mean of some value differs between games with and without each card
+    in the kingdom. Only cards that were in some but not all kingdoms are kept.
+    """
+
+    cards: t.List[str]
+    with_count: np.ndarray
+    with_mean: np.ndarray
+    without_count: np.ndarray
+    without_mean: np.ndarray
+    # Mean with the card less mean without it, and the standard error of that.
+    effect: np.ndarray
+    standard_error: np.ndarray
+
+    def __init__(self, cards: t.List[str], presence: np.ndarray, values: np.ndarray):
+        values = np.asarray(values, dtype=float)
+        presence = presence.astype(float)
+        total = len(values)
+        with_count = presence.sum(axis=0)
+        with_sum = values @ presence
+        with_squares = (values * values) @ presence
+        without_count = total - with_count
+        without_sum = values.sum() - with_sum
+        without_squares = (values * values).sum() - with_squares
+        varying = (with_count > 0) & (without_count > 0)
+        self.cards = [card for card, kept in zip(cards, varying) if kept]
+        self.with_count = with_count[varying].astype(int)
+        self.without_count = without_count[varying].astype(int)
+        self.with_mean = with_sum[varying] / self.with_count
+        self.without_mean = without_sum[varying] / self.without_count
+        with_variance = (
+            with_squares[varying] - self.with_count * self.with_mean**2
+        ) / np.maximum(self.with_count - 1, 1)
+        without_variance = (
+            without_squares[varying] - self.without_count * self.without_mean**2
+        ) / np.maximum(self.without_count - 1, 1)
+        self.effect = self.with_mean - self.without_mean
+        self.standard_error = np.sqrt(
+            np.maximum(with_variance, 0) / self.with_count
+            + np.maximum(without_variance, 0) / self.without_count
+        )
+
+    def view(self) -> str:
+        order = np.argsort(-self.effect)
+        return "\n".join(
+            f"{self.cards[i].rsplit('.', 1)[-1]}: {self.effect[i]:+.4g} "
+            f"± {self.standard_error[i]:.2g} "
+            f"(n={self.with_count[i]} with, {self.without_count[i]} without)"
+            for i in order
+        )
+
+    def __str__(self) -> str:
+        return self.view()
+
+
+def card_effects(
+    results: "Results", values: np.ndarray, mask: t.Optional[np.ndarray] = None
+) -> CardEffects:
+    """The effect of each kingdom card on `values`, over the entries in `mask`."""
+    games = results.game if mask is None else results.game[mask]
+    values = values if mask is None else values[mask]
+    return CardEffects(results.cards, results.kingdom[games], values)
+
+
+def kingdom_presence(kingdoms: np.ndarray, n_cards: int) -> np.ndarray:
+    """Turns rows of kingdom card ids into rows of flags by card id."""
+    presence = np.zeros((len(kingdoms), n_cards + 1), dtype=bool)
+    # Unused slots all mark an extra column, dropped at the end.
+    card_ids = np.where(kingdoms == NO_ID, n_cards, kingdoms)
+    presence[np.arange(len(kingdoms))[:, np.newaxis], card_ids] = True
+    return presence[:, :n_cards]
+
+
+class Results:  # pylint: disable=too-many-instance-attributes
+    """
+    Games flattened into entries, one per player per game, in game then seat order.
+
+    Entry arrays are indexed by entry, game arrays by game: `kingdom[game]` is the
+    kingdom of each entry. Deck counts stay in their column, memory-mapped when
+    loaded from a store, and are only read a card at a time.
+    """
+
+    # Qualified names of the cards and bots behind each id.
+    cards: t.List[str]
+    bots: t.List[str]
+    # Entry arrays.
+    game: np.ndarray
+    seat: np.ndarray
+    bot: np.ndarray
+    score: np.ndarray
+    # Score less the best score of the other players.
+    margin: np.ndarray
+    # 1 for an outright win, split evenly between tied winners, else 0.
+    share: np.ndarray
+    turns: np.ndarray
+    # Game arrays: whether each card id is in the kingdom, and every column as stored.
+    kingdom: np.ndarray
+    columns: t.Dict[str, np.ndarray]
+
+    def __init__(
+        self, columns: t.Dict[str, np.ndarray], cards: t.List[str], bots: t.List[str]
+    ) -> None:
+        self.columns = columns
+        self.cards = cards
+        self.bots = bots
+        seats = columns["bots"] != NO_ID
+        self.game, self.seat = np.nonzero(seats)
+        self.bot = columns["bots"][self.game, self.seat].astype(int)
+
+        # Empty seats score below anyone.
+        lowest = np.iinfo(np.int32).min
+        scores = np.where(seats, columns["scores"].astype(np.int32), lowest)
+        ranked = np.sort(scores, axis=1)
+        best, runner_up = ranked[:, -1:], ranked[:, -2:-1]
+        winners = scores == best
+        shares = winners / winners.sum(axis=1, keepdims=True)
+        best_opponent = np.where(scores == best, runner_up, best)
+        self.score = scores[self.game, self.seat]
+        self.margin = np.where(
+            best_opponent[self.game, self.seat] == lowest,
+            0,
+            self.score - best_opponent[self.game, self.seat],
+        )
+        self.share = shares[self.game, self.seat]
+        self.turns = columns["turns"][self.game].astype(int)
+
+        self.kingdom = kingdom_presence(columns["kingdom"], len(cards))
+
+    @classmethod
+    def from_store(cls, store: ResultStore) -> "Results":
+        columns = {name: store.column(name) for name in store.columns}
+        return cls(columns, store.cards, store.bots)
+
+    @classmethod
+    def from_summaries(cls, summaries: t.Sequence[GameSummary]) -> "Results":
+        """Results of games in memory, like the summaries of `Report`s."""
+        bots: t.List[str] = []
+        cards = [qualified_name(registry[card_id]) for card_id in range(len(registry))]
+        columns = encode(
+            summaries,
+            bots,
+            CardIds(cards, len(cards)),
+            max((len(summary.players) for summary in summaries), default=0),
+            max((summary.kingdom_size for summary in summaries), default=0),
+        )
+        return cls(columns, cards, bots)
+
+    def __len__(self) -> int:
+        return len(self.game)
+
+    def card_id(self, card: t.Type[Card]) -> int:
+        return self.cards.index(qualified_name(card))
+
+    def bot_id(self, bot: t.Type[Player]) -> int:
+        return self.bots.index(qualified_name(bot))
+
+    def in_kingdom(self, card: t.Type[Card]) -> np.ndarray:
+        """Whether `card` was in the kingdom of each entry's game."""
+        return self.kingdom[self.game, self.card_id(card)]
+
+    def deck_count(self, card: t.Type[Card]) -> np.ndarray:
+        """Copies of `card` in each entry's final deck."""
+        return self.columns["decks"][self.game, self.seat, self.card_id(card)]
@@ -0,0 +1,319 @@
+"""
+Simulate thousands of games between non-interactive bots at once with NumPy.
+
+Only `RuleBot`s are supported, and every card they buy or play must be a plain
+Treasure, a fixed-point Victory or Curse card, or a vanilla Action that only gives
++Cards, like Smithy.
+Kingdom cards nobody buys may be anything.
+
+Each seat of each game is a row of card counts for its draw pile, discard pile and
+hand. The draw pile is always a uniformly shuffled pile of the cards it counts, so
+drawing from its top is the same as drawing at random without replacement from
+the counts, and a reshuffle is just moving the discard counts over.
+Games are played in lockstep one seat at a time, and drop out as they end.
+
+Requires the optional `numpy` dependency (`pip install pydominion[batch]`).
+"""
+import typing as t
+
+import numpy as np
+
+from dominion.cards.action import Action
+from dominion.cards.card import Card, CardTypes
+from dominion.cards.registry import (
+    ACTION,
+    CURSE,
+    TREASURE,
+    VANILLA,
+    VARIABLE_POINTS,
+    VICTORY,
+    registry,
+)
+from dominion.cards.treasure import Copper
+from dominion.cards.victory import Estate, Province
+from dominion.errors import UnsupportedCardError
+from dominion.game import Game
+from dominion.player import PlayerTypes
+from dominion.rules import (
+    Condition,
+    CountAtLeast,
+    CountBelow,
+    PileAtLeast,
+    PileBelow,
+    RuleBot,
+)
+from dominion.stats import RunningStats
+from dominion.tournament import TournamentResult
+
+# Buy rule conditions the batch engine can test.
+BATCH_CONDITIONS = (PileBelow, PileAtLeast, CountBelow, CountAtLeast)
+
+
+def supported(card: t.Type[Card]) -> bool:
+    """Whether the batch engine can play games with `card` in a deck."""
+    if card.type_flags & ACTION:
+        # Only terminal draws, so a turn plays at most one Action and buys once.
+        action = t.cast(t.Type[Action], card)
+        return bool(card.type_flags & VANILLA) and not (
+            action.plus_actions or action.plus_buys or action.plus_coins
+        )
+    if card.type_flags & TREASURE:
+        # Treasures with their own effect may be worth more than `coins`.
+        return bool(card.type_flags & VANILLA)
+    if card.type_flags & (VICTORY | CURSE):
+        return not card.type_flags & VARIABLE_POINTS
+    return False
+
+
+def check(players: PlayerTypes) -> None:
+    """Raises UnsupportedCardError unless every bot can be batch simulated."""
+    for player in players:
+        if not issubclass(player, RuleBot):
+            raise UnsupportedCardError(
+                f"{player.__qualname__} is not a RuleBot, it cannot be batch simulated."
+            )
+        cards = [rule.card for rule in player.buy_rules] + player.play_priority
+        for card in cards:
+            if not supported(card):
+                raise UnsupportedCardError(
+                    f"{player.__qualname__} uses {card.name}, "
+                    "which cannot be batch simulated."
+                )
+        for rule in player.buy_rules:
+            for condition in rule.conditions:
+                if not isinstance(condition, BATCH_CONDITIONS):
+                    raise UnsupportedCardError(
+                        f"{player.__qualname__} buys {rule.card.name} under a "
+                        f"{condition.__class__.__qualname__}, "
+                        "which cannot be batch simulated."
+                    )
+
+
+class Batch:  # pylint: disable=too-many-instance-attributes
+    """A batch of games between the same bots, all played to the end together."""
+
+    players: t.List[t.Type[RuleBot]]
+    # Cards that can be in a deck; deck columns follow this order.
+    cards: CardTypes
+    coins: np.ndarray
+    points: np.ndarray
+    supply_columns: t.Dict[t.Type[Card], int]
+    # The supply column of each deck column.
+    piles: np.ndarray
+    province: int
+    plays: t.List[t.List[t.Tuple[int, int]]]
+    buy_columns: t.List[np.ndarray]
+    buy_thresholds: t.List[np.ndarray]
+    buy_conditions: t.List[t.List[t.Tuple[Condition, ...]]]
+    # Rows are games. The supply has a column per pile, the rest per deck card
+    # and are stacked by seat.
+    supply: np.ndarray
+    draw_piles: np.ndarray
+    discard_piles: np.ndarray
+    hands: np.ndarray
+    rng: np.random.Generator
+
+    def __init__(
+        self,
+        players: PlayerTypes,
+        kingdom: CardTypes,
+        n_games: int,
+        rng: np.random.Generator,
+    ) -> None:
+        check(players)
+        self.players = t.cast(t.List[t.Type[RuleBot]], list(players))
+        self.rng = rng
+        # The supply a regular game between these players starts with.
+        supply = Game(players, kingdom).supply
+        piles = {card: i for i, card in enumerate(supply)}
+        self.supply_columns = piles
+        self.province = piles[Province]
+        # Cards missing from the supply can never end up in a deck.
+        self.cards = [Copper, Estate]
+        for player in self.players:
+            for card in [rule.card for rule in player.buy_rules]:
+                if card in piles and card not in self.cards:
+                    self.cards.append(card)
+        column = {card: i for i, card in enumerate(self.cards)}
+        self.piles = np.array([piles[card] for card in self.cards])
+        self.coins = np.array(
+            [card.coins if card.type_flags & TREASURE else 0 for card in self.cards]
+        )
+        self.points = np.array([registry.points[card.card_id] for card in self.cards])
+        self.plays = [
+            [
+                (column[card], t.cast(t.Type[Action], card).plus_cards)
+                for card in player.play_priority
+                if card in column
+            ]
+            for player in self.players
+        ]
+        self.buy_columns = []
+        self.buy_thresholds = []
+        self.buy_conditions = []
+        for player in self.players:
+            rules = [rule for rule in player.buy_rules if rule.card in column]
+            self.buy_columns.append(
+                np.array([column[rule.card] for rule in rules], dtype=int)
+            )
+            self.buy_thresholds.append(
+                np.array([rule.coins for rule in rules], dtype=int)
+            )
+            self.buy_conditions.append([rule.conditions for rule in rules])
+
+        seats = len(self.players)
+        shape = (seats, n_games, len(self.cards))
+        self.supply = np.tile(np.array(list(supply.values())), (n_games, 1))
+        self.draw_piles = np.zeros(shape, dtype=np.int32)
+        self.draw_piles[:, :, column[Copper]] = 7
+        self.draw_piles[:, :, column[Estate]] = 3
+        self.discard_piles = np.zeros(shape, dtype=np.int32)
+        self.hands = np.zeros(shape, dtype=np.int32)
+        everyone = np.arange(n_games)
+        for seat in range(seats):
+            self.draw(seat, everyone, 5)
+
+    def draw(self, seat: int, games: np.ndarray, amount: int) -> None:
+        """Draws `amount` cards for `seat` in each of `games`, reshuffling as needed."""
+        draw_pile = self.draw_piles[seat]
+        discard_pile = self.discard_piles[seat]
+        hand = self.hands[seat]
+        for _ in range(amount):
+            totals = draw_pile[games].cumsum(axis=1)
+            sizes = totals[:, -1]
+            empty = games[sizes == 0]
+            if empty.size:
+                draw_pile[empty] = discard_pile[empty]
+                discard_pile[empty] = 0
+                totals = draw_pile[games].cumsum(axis=1)
+                sizes = totals[:, -1]
+            # A deck that is entirely in hand has nothing left to draw.
+            drawing = sizes > 0
+            picks = self.rng.integers(0, np.maximum(sizes, 1))
+            cards = (totals > picks[:, np.newaxis]).argmax(axis=1)
+            rows, cards = games[drawing], cards[drawing]
+            draw_pile[rows, cards] -= 1
+            hand[rows, cards] += 1
+
+    def take_turn(self, seat: int, games: np.ndarray) -> None:
+        hand = self.hands[seat]
+        # Every playable Action is terminal, so only the first one held is played.
+        playing = np.zeros(games.size, dtype=bool)
+        for col, cards in self.plays[seat]:
+            play = (hand[games, col] > 0) & ~playing
+            playing |= play
+            rows = games[play]
+            if rows.size:
+                # Played Actions go straight to the discard pile, before they draw.
+                hand[rows, col] -= 1
+                self.discard_piles[seat, rows, col] += 1
+                self.draw(seat, rows, cards)
+
+        if self.buy_columns[seat].size:
+            self.buy(seat, games)
+        self.discard_piles[seat, games] += hand[games]
+        hand[games] = 0
+        self.draw(seat, games, 5)
+
+    def buy(self, seat: int, games: np.ndarray) -> None:
+        """Buys the card of the first rule that applies, like `RuleBot.buy_phase`."""
+        columns = self.buy_columns[seat]
+        coins = self.hands[seat, games] @ self.coins
+        buyable = (coins[:, np.newaxis] >= self.buy_thresholds[seat]) & (
+            self.supply[games][:, self.piles[columns]] > 0
+        )
+        for i, conditions in enumerate(self.buy_conditions[seat]):
+            for condition in conditions:
+                buyable[:, i] &= self.holds(condition, seat, games)
+        buying = buyable.any(axis=1)
+        rows = games[buying]
+        cards = columns[buyable.argmax(axis=1)[buying]]
+        self.supply[rows, self.piles[cards]] -= 1
+        self.discard_piles[seat, rows, cards] += 1
+
+    def holds(self, condition: Condition, seat: int, games: np.ndarray) -> np.ndarray:
+        """Whether a buy rule condition holds for `seat` in each of `games`."""
+        values = np.zeros(games.size, dtype=int)
+        if isinstance(condition, (PileBelow, PileAtLeast)):
+            if condition.card in self.supply_columns:
+                values = self.supply[games, self.supply_columns[condition.card]]
+        elif condition.card in self.cards:
+            col = self.cards.index(condition.card)
+            values = (
+                self.draw_piles[seat, games, col]
+                + self.discard_piles[seat, games, col]
+                + self.hands[seat, games, col]
+            )
+        if isinstance(condition, (PileBelow, CountBelow)):
+            return values < condition.amount
+        return values >= condition.amount
+
+    def ended(self, games: np.ndarray) -> np.ndarray:
+        supply = self.supply[games]
+        return (supply[:, self.province] == 0) | ((supply == 0).sum(axis=1) >= 3)
+
+    def play(self, max_turns: int) -> np.ndarray:
+        """Plays every game to the end, returns scores by seat and game."""
+        playing = np.arange(self.supply.shape[0])
+        for _ in range(max_turns):
+            for seat in range(len(self.players)):
+                self.take_turn(seat, playing)
+                playing = playing[~self.ended(playing)]
+                if not playing.size:
+                    break
+            if not playing.size:
+                break
+        decks = self.draw_piles + self.discard_piles + self.hands
+        return decks @ self.points
+
+
+def record(result: TournamentResult, players: PlayerTypes, scores: np.ndarray) -> None:
+    """Adds the games scored in `scores` (by seat and game) to `result`."""
+    seating = tuple(players)
+    winners = scores == scores.max(axis=0)
+    rotation = result.rotation_wins.setdefault(seating, dict.fromkeys(seating, 0))
+    for seat, player in enumerate(players):
+        wins = int(winners[seat].sum())
+        result.wins[player] += wins
+        rotation[player] += wins
+    result.games += scores.shape[1]
+    result.rotation_games[seating] = (
+        result.rotation_games.get(seating, 0) + scores.shape[1]
+    )
+    statistics = result.statistics
+    if statistics is not None:
+        margins = (
+            scores[players.index(statistics.first)]
+            - scores[players.index(statistics.second)]
+        )
+        statistics.wins += int((margins > 0).sum())
+        statistics.losses += int((margins < 0).sum())
+        statistics.draws += int((margins == 0).sum())
+        batch = RunningStats()
+        batch.count = margins.size
+        batch.mean = float(margins.mean())
+        batch.sum_of_squares = float(((margins - batch.mean) ** 2).sum())
+        statistics.margins.merge(batch)
+
+
+def run(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    players: PlayerTypes,
+    kingdom: CardTypes,
+    n_games: int,
+    seed: t.Optional[int] = None,
+    batch_size: int = 10000,
+    max_turns: int = 1000,
+) -> TournamentResult:
+    """
+    Plays `n_games` between `players` on `kingdom`, `batch_size` games at a time.
+
+    Gives the same statistics as `tournament.run` for the same players and kingdom,
+    only much faster. Games still going after `max_turns` rounds are scored as is.
+    """
+    players = list(players)
+    rng = np.random.default_rng(seed)
+    result = TournamentResult(players)
+    for start in range(0, n_games, batch_size):
+        batch = Batch(players, kingdom, min(batch_size, n_games - start), rng)
+        record(result, players, batch.play(max_turns))
+    return result
@@ -3,6 +3,7 @@ import typing as t
 from abc import abstractmethod
 
 from dominion.cards.card import Card, KingdomCard
+from dominion.cards.registry import ACTION, ATTACK, REACTION
 from dominion.errors import NoActionsAvailableError
 from dominion.event import Event
 
@@ -15,15 +16,38 @@ else:
 
 
 class Action(KingdomCard):
+    card_type: int = ACTION
+    # Bonuses the generic `effect` gives, most cards only need to declare these.
+    plus_cards: int = 0
+    plus_actions: int = 0
+    plus_buys: int = 0
+    plus_coins: int = 0
+
     @classmethod
     def play(cls, deck: Deck) -> None:
-        super(Action, cls).play(deck)
+        if deck.game.log_events:
+            deck.game.log(deck, "Played a", cls.name)
         if deck.actions <= 0:
             raise NoActionsAvailableError("No actions available.")
         deck.actions -= 1
         deck.discard([cls])
+        cls.resolve(deck)
+        if deck.game.log_events:
+            deck.game.log(deck, "Actions left:", deck.actions)
+
+    @classmethod
+    def resolve(cls, deck: Deck) -> None:
+        """Carries out the effect of the card once `play` has paid for it."""
         cls.effect(deck)
-        print(deck.actions)
+
+    @classmethod
+    def effect(cls, deck: Deck) -> None:
+        """+Cards, +Actions, +Buys and +Coins as declared by the card."""
+        if cls.plus_cards:
+            deck.draw(cls.plus_cards)
+        deck.actions += cls.plus_actions
+        deck.buys += cls.plus_buys
+        deck.coins += cls.plus_coins
 
     @classmethod
     def setup(cls, players: Players) -> int:
@@ -32,6 +56,8 @@ class Action(KingdomCard):
 
 
 class Reaction(Action):
+    card_type: int = REACTION
+
     @classmethod
     @abstractmethod
     def when_draw(cls, deck: Deck, card: t.Type[Card]) -> None:
@@ -69,12 +95,16 @@ class Reaction(Action):
 
 
 class Attack(Action):
+    card_type: int = ATTACK
+
     @classmethod
-    def play(cls, deck: Deck) -> None:
-        Action.play(deck)
-        targets = copy.copy(deck.game.players)
-        # Allows the current player to activate reaction cards.
-        deck.game.dispatch_event(deck, Event.ATTACK_EVENT, cls, targets)
+    def resolve(cls, deck: Deck) -> None:
+        targets = deck.game.players
+        if deck.game.reactive:
+            # Reactions like Moat take their player out of the copied targets.
+            targets = copy.copy(targets)
+            # Allows the current player to activate reaction cards.
+            deck.game.dispatch_event(deck, Event.ATTACK_EVENT, cls, targets)
         # Exclude the current player from attack effects by default.
         cls.effect(deck, [player for player in targets if player != deck.player])
 
@@ -1,5 +1,6 @@
 import typing as t
 
+from dominion.cards.registry import registry
 from dominion.errors import (
     EmptySupplyPileError,
     NoActionsAvailableError,
@@ -17,34 +18,37 @@ else:
 class Card:
     cost: int = 0
     name: str = "Blank Card"
+    # Coins a Treasure is worth, points a Victory or Curse card is worth.
+    coins: int = 0
+    victory_points: int = 0
+    # Set by the card registry, see `dominion.cards.registry`.
+    card_id: int
+    type_flags: int
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        registry.register(cls)
 
     @classmethod
     def buy(cls, deck: Deck) -> None:
         if deck.buys <= 0:
             raise NoActionsAvailableError("You have no buys left.")
-        if cls in deck.game.kingdom_cards:
-            if deck.game.kingdom_cards[cls] <= 0:
-                raise EmptySupplyPileError(f"Cannot buy a {cls.name}, none are left.")
-            deck.game.kingdom_cards[cls] -= 1
-        elif cls in deck.game.base_cards:
-            if deck.game.base_cards[cls] <= 0:
-                raise EmptySupplyPileError(f"Cannot buy a {cls.name}, none are left.")
-            deck.game.base_cards[cls] -= 1
-        if deck.coins >= cls.cost:
-            deck.coins -= cls.cost
-            deck.buys -= 1
-            deck.discard_pile.append(cls)
-            deck.game.log(deck, "You bought the", cls.name)
-        else:
+        if deck.coins < cls.cost:
             raise UnaffordableError(f"You cannot afford to buy a {cls.name}")
+        if not deck.game.supply.available(cls):
+            raise EmptySupplyPileError(f"Cannot buy a {cls.name}, none are left.")
+        deck.game.supply.take(cls)
+        deck.coins -= cls.cost
+        deck.buys -= 1
+        deck.gain(cls, trigger_reactions=False)
+        if deck.game.log_events:
+            deck.game.log(deck, "You bought the", cls.name)
 
     @classmethod
     def play(cls, deck: Deck) -> None:
         """Logs that this card was played."""
-        deck.game.log(
-            deck,
-            f"[{deck.game.get_player(deck).player_id}] Played a {cls.name}",
-        )
+        if deck.game.log_events:
+            deck.game.log(deck, "Played a", cls.name)
 
     @classmethod
     def effect(cls, deck: Deck) -> None:
@@ -57,6 +61,9 @@ class Card:
         return 0
 
 
+registry.register(Card)
+
+
 class BaseCard(Card):  # pylint: disable=abstract-method
     pass
 
@@ -1,6 +1,7 @@
 import typing as t
 
 from .card import BaseCard
+from .registry import CURSE
 
 if t.TYPE_CHECKING:
     from ..deck import Deck
@@ -12,10 +13,12 @@ else:
 
 class Curse(BaseCard):
     name: str = "Curse"
+    card_type: int = CURSE
+    victory_points: int = -1
 
     @classmethod
     def points(cls, deck: Deck) -> int:  # pylint: disable=unused-argument
-        return -1
+        return cls.victory_points
 
     @classmethod
     def setup(cls, players: Players) -> int:
@@ -4,7 +4,8 @@ import typing as t
 from dominion.cards.action import Action, Attack, Reaction
 from dominion.cards.card import Card, KingdomCard
 from dominion.cards.curse import Curse
-from dominion.cards.treasure import Copper, Silver, Treasure
+from dominion.cards.registry import ACTION, TREASURE, VICTORY
+from dominion.cards.treasure import Copper, Silver
 from dominion.cards.victory import Victory
 from dominion.deck import Deck
 from dominion.errors import CardNotFoundError
@@ -80,8 +81,8 @@ class Chapel(Action):
             else:
                 break
         for card in cards:
-            if card in deck.hand:
-                deck.trash(deck.hand.pop(deck.hand.index(card)))
+            if deck.in_hand(card):
+                deck.trash(deck.remove_from_hand(card))
             else:
                 raise CardNotFoundError(
                     f"Cannot trash the {card.name}, it is not in your hand."
@@ -91,13 +92,7 @@ class Chapel(Action):
 class Moat(Reaction):
     name: str = "Moat"
     cost: int = 2
-
-    @classmethod
-    def effect(cls, deck: Deck) -> None:
-        """
-        +2 Cards
-        """
-        deck.draw(2)
+    plus_cards: int = 2
 
     @classmethod
     def when_attack(cls, deck: Deck, card: t.Type[Card], targets: Players) -> None:
@@ -105,7 +100,7 @@ class Moat(Reaction):
         When another player plays an Attack card,
         you can first reveal this card and then be unaffected by it.
         """
-        player = deck.game.get_player(deck)
+        player = deck.player
         if player.deck.reveal(cls):
             targets.remove(player)
 
@@ -122,43 +117,28 @@ class Chancellor(Action):
         """
         deck.coins += 2
         if (
-            deck.game.get_player(deck).choice(
+            deck.player.choice(
                 cls,
                 "You may immediately put your deck in the discard pile:",
                 ["Yes", "No"],
             )
             == "Yes"
         ):
-            deck.discard_pile += deck.draw_pile
-            deck.draw_pile = []
+            deck.discard_draw_pile()
 
 
 class Village(Action):
     name: str = "Village"
     cost: int = 3
-
-    @classmethod
-    def effect(cls, deck: Deck) -> None:
-        """
-        +1 Card
-        +2 Actions
-        """
-        deck.draw()
-        deck.actions += 2
+    plus_cards: int = 1
+    plus_actions: int = 2
 
 
 class Woodcutter(Action):
     name: str = "Woodcutter"
     cost: int = 3
-
-    @classmethod
-    def effect(cls, deck: Deck) -> None:
-        """
-        +1 Buy
-        +2 Coins
-        """
-        deck.buys += 1
-        deck.coins += 2
+    plus_buys: int = 1
+    plus_coins: int = 2
 
 
 class Workshop(Action):
@@ -168,11 +148,12 @@ class Workshop(Action):
     @classmethod
     def effect(cls, deck: Deck) -> None:
         """Gain a card costing up to four coins."""
-        deck.game.get_player(deck).choice(
-            cls,
-            "Gain a card costing up to four coins:",
-            [card for card in deck.game.available_cards if card.cost <= 4],
-        )
+        if choices := list(deck.game.supply.costing_at_most(4)):
+            deck.gain_from_supply(
+                deck.player.choice(
+                    cls, "Gain a card costing up to four coins:", choices
+                )
+            )
 
 
 class Bureaucrat(Attack):
@@ -186,11 +167,11 @@ class Bureaucrat(Attack):
         Each other player reveals a Victory card from their hand and
         puts it onto their deck (or reveals a hand with no Victory cards).
         """
-        deck.draw_pile.insert(0, Silver)
+        deck.gain_from_supply(Silver, deck.gain_to_draw_pile)
         for player in deck.game.players:
             for card in player.deck.hand:
-                if issubclass(card, Victory):
-                    player.deck.draw_pile.insert(0, card)
+                if card.type_flags & VICTORY:
+                    player.deck.put_on_top(player.deck.remove_from_hand(card))
                     break
 
 
@@ -201,7 +182,7 @@ class Gardens(Victory, KingdomCard):
     @classmethod
     def points(cls, deck: Deck) -> int:
         """Worth 1 Victory Point for every 10 cards in your deck (rounded down)."""
-        return len(deck.cards) // 10
+        return deck.card_count // 10
 
 
 class Militia(Attack):
@@ -218,11 +199,13 @@ class Militia(Attack):
         for player in targets:
             for _ in range(max([3, len(player.deck.hand)]) - 3):
                 player.deck.discard(
-                    player.choice(
-                        cls,
-                        "Choose one card from your hand to discard",
-                        player.deck.hand,
-                    )
+                    [
+                        player.choice(
+                            cls,
+                            "Choose one card from your hand to discard",
+                            player.deck.hand,
+                        )
+                    ]
                 )
 
 
@@ -235,9 +218,8 @@ class Moneylender(Action):
         """
         You may trash a Copper from your hand for +3 coins.
         """
-        if Copper in deck.hand:
-            deck.hand.remove(Copper)
-            deck.trash(Copper)
+        if deck.in_hand(Copper):
+            deck.trash(deck.remove_from_hand(Copper))
             deck.coins += 3
 
 
@@ -250,10 +232,11 @@ class Feast(Action):
         """
         You may trash this card and gain a card costing up to 5 Coins.
         """
-        deck.discard_pile.remove(cls)
-        deck.trash(cls)
-        choices = [card for card in deck.game.available_cards if card.cost <= 5]
-        deck.gain(deck.player.choice(cls, "Which card do you want to gain?", choices))
+        deck.trash(deck.remove_from_discard_pile(cls))
+        if choices := list(deck.game.supply.costing_at_most(5)):
+            deck.gain_from_supply(
+                deck.player.choice(cls, "Which card do you want to gain?", choices)
+            )
 
 
 class Remodel(Action):
@@ -268,21 +251,24 @@ class Remodel(Action):
         """
         if deck.hand:
             trashed_card = deck.trash(
-                deck.player.choice(
-                    cls, "Which card do you want to trash from your hand?", deck.hand
+                deck.remove_from_hand(
+                    deck.player.choice(
+                        cls,
+                        "Which card do you want to trash from your hand?",
+                        deck.hand,
+                    )
                 )
             )
-            if available_card_choices := [
-                card
-                for card in deck.game.available_cards
-                if card.cost >= trashed_card.cost + 2
-            ]:
-                deck.gain_to_hand(
+            if available_card_choices := list(
+                deck.game.supply.costing_at_least(trashed_card.cost + 2)
+            ):
+                deck.gain_from_supply(
                     deck.player.choice(
                         cls,
                         "Which Treasure do you want to gain?",
                         available_card_choices,
-                    )
+                    ),
+                    deck.gain_to_hand,
                 )
             else:
                 deck.game.log(deck, "No cards available to be gained.")
@@ -291,13 +277,7 @@ class Remodel(Action):
 class Smithy(Action):
     name: str = "Smithy"
     cost: int = 4
-
-    @classmethod
-    def effect(cls, deck: Deck) -> None:
-        """
-        +3 Cards
-        """
-        deck.draw(3)
+    plus_cards: int = 3
 
 
 class Spy(Attack):
@@ -315,13 +295,14 @@ class Spy(Attack):
         deck.draw()
         deck.actions += 1
         for player in targets + [deck.player]:
-            for i, card in enumerate(player.deck.draw_pile[0:2]):
+            for card in player.deck.peek(2):
                 player.deck.reveal(card)
                 if (
                     player.choice(cls, f"Discard the {card.name}", ["Yes", "No"])
                     == "Yes"
                 ):
-                    player.deck.hand.append(player.deck.draw_pile.pop(i))
+                    player.deck.draw_pile.remove(card)
+                    player.deck.add_to_hand(card)
                     player.deck.discard([card])
 
 
@@ -339,9 +320,7 @@ class Thief(Attack):
         """
         for player in targets:
             choices = [
-                card
-                for card in player.deck.draw_pile[0:2]
-                if issubclass(card, Treasure)
+                card for card in player.deck.peek(2) if card.type_flags & TREASURE
             ]
             if choices:
                 target_card = deck.player.choice(
@@ -374,7 +353,7 @@ class ThroneRoom(Action):
         You may play it twice.
         """
         if action_cards_in_hand := [
-            card for card in deck.hand if issubclass(card, Action)
+            card for card in deck.hand if card.type_flags & ACTION
         ]:
             card = deck.player.choice(
                 cls,
@@ -388,6 +367,8 @@ class ThroneRoom(Action):
 class CouncilRoom(Action):
     name: str = "Council Room"
     cost: int = 5
+    plus_cards: int = 4
+    plus_buys: int = 1
 
     @classmethod
     def effect(cls, deck: Deck) -> None:
@@ -396,40 +377,25 @@ class CouncilRoom(Action):
         +1 Buy
         Each other player draws a card.
         """
-        deck.draw(4)
-        deck.buys += 1
+        super().effect(deck)
         for player in deck.game.players:
-            player.deck.draw()
+            if player.deck is not deck:
+                player.deck.draw()
 
 
 class Festival(Action):
     name: str = "Festival"
     cost: int = 5
-
-    @classmethod
-    def effect(cls, deck: Deck) -> None:
-        """
-        +2 Actions
-        +1 Buy
-        +2 Coins
-        """
-        deck.actions += 2
-        deck.buys += 1
-        deck.coins += 2
+    plus_actions: int = 2
+    plus_buys: int = 1
+    plus_coins: int = 2
 
 
 class Laboratory(Action):
     name: str = "Laboratory"
     cost: int = 5
-
-    @classmethod
-    def effect(cls, deck: Deck) -> None:
-        """
-        +2 Cards
-        +1 Action
-        """
-        deck.draw(2)
-        deck.actions += 1
+    plus_cards: int = 2
+    plus_actions: int = 1
 
 
 class Library(Action):
@@ -446,7 +412,7 @@ class Library(Action):
         """
         while len(deck.hand) < 7:
             drawn_card = deck.draw()[0]
-            if issubclass(drawn_card, Action):
+            if drawn_card.type_flags & ACTION:
                 if (
                     deck.player.choice(
                         cls,
@@ -461,19 +427,10 @@ class Library(Action):
 class Market(Action):
     name: str = "Market"
     cost: int = 5
-
-    @classmethod
-    def effect(cls, deck: Deck) -> None:
-        """
-        +1 Card
-        +1 Action
-        +1 Buy
-        +1 Coin
-        """
-        deck.draw()
-        deck.actions += 1
-        deck.buys += 1
-        deck.coins += 1
+    plus_cards: int = 1
+    plus_actions: int = 1
+    plus_buys: int = 1
+    plus_coins: int = 1
 
 
 class Mine(Action):
@@ -487,24 +444,29 @@ class Mine(Action):
         Gain a Treasure card costing up to 3 Coins more than it.
         """
         if treasure_cards_in_hand := [
-            card for card in deck.hand if issubclass(card, Treasure)
+            card for card in deck.hand if card.type_flags & TREASURE
         ]:
             trashed_card = deck.trash(
-                deck.player.choice(
-                    cls, "Which Treasure do you want to trash?", treasure_cards_in_hand
+                deck.remove_from_hand(
+                    deck.player.choice(
+                        cls,
+                        "Which Treasure do you want to trash?",
+                        treasure_cards_in_hand,
+                    )
                 )
             )
             if available_treasure_cards := [
                 card
-                for card in deck.game.available_cards
-                if issubclass(card, Treasure) and card.cost >= trashed_card.cost + 3
+                for card in deck.game.supply.costing_at_least(trashed_card.cost + 3)
+                if card.type_flags & TREASURE
             ]:
-                deck.gain_to_hand(
+                deck.gain_from_supply(
                     deck.player.choice(
                         cls,
                         "Which Treasure do you want to gain?",
                         available_treasure_cards,
-                    )
+                    ),
+                    deck.gain_to_hand,
                 )
             else:
                 deck.game.log(deck, "No Treasure cards available to be gained.")
@@ -522,7 +484,7 @@ class Witch(Attack):
         """
         deck.draw(2)
         for player in targets:
-            player.deck.discard_pile.append(Curse)
+            player.deck.gain_from_supply(Curse)
 
 
 class Adventurer(Action):
@@ -535,10 +497,10 @@ class Adventurer(Action):
         Reveal cards from your deck until your reveal two Treasure cards.
         Put those Treasure cards in your hand and discard the other revealed cards.
         """
-        revealed_treasure_cards: t.List[t.Type[Treasure]] = []
+        revealed_treasure_cards: t.List[t.Type[Card]] = []
         while len(revealed_treasure_cards) < 2:
             card = deck.reveal(deck.draw()[0])
-            if issubclass(card, Treasure):
+            if card.type_flags & TREASURE:
                 revealed_treasure_cards.append(card)
             else:
                 deck.discard([card])
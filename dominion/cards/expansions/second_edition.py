@@ -23,7 +23,8 @@ from dominion.cards.expansions.first_edition import (
     Witch,
     Workshop,
 )
-from dominion.cards.treasure import Copper, Gold, Treasure
+from dominion.cards.registry import TREASURE
+from dominion.cards.treasure import Copper, Gold
 from dominion.deck import Deck
 from dominion.player import Player
 
@@ -72,13 +73,12 @@ class Harbinger(Action):
         deck.draw()
         deck.actions += 1
         if deck.discard_pile:
-            if chosen_card := deck.game.get_player(deck).choice(
+            if chosen_card := deck.player.choice(
                 cls,
                 "What card from your discard pile do you choose?",
-                deck.discard_pile,
+                list(deck.discard_pile),
             ):
-                deck.discard_pile.remove(chosen_card)
-                deck.draw_pile.insert(0, chosen_card)
+                deck.put_on_top(deck.remove_from_discard_pile(chosen_card))
 
 
 class Merchant(Action):
@@ -123,7 +123,7 @@ class Poacher(Action):
         deck.draw()
         deck.actions += 1
         deck.coins += 1
-        cards_to_discard = len(deck.game.empty_supply_piles)
+        cards_to_discard = deck.game.supply.empty_piles
         for i in range(cards_to_discard):
             deck.discard(
                 [
@@ -148,14 +148,14 @@ class Bandit(Attack):
         and trashes any other revealed treasure cards other than Copper
         and discards the rest.
         """
-        deck.gain(Gold)
+        deck.gain_from_supply(Gold)
         for player in targets:
-            for i, card in enumerate(player.deck.draw_pile[0:2]):
-                player.deck.draw_pile.pop(i)
-                if issubclass(card, Treasure) and card != Copper:
+            for card in player.deck.peek(2):
+                player.deck.draw_pile.remove(card)
+                if card.type_flags & TREASURE and card != Copper:
                     player.deck.trash(card)
                 else:
-                    player.deck.hand.append(card)
+                    player.deck.add_to_hand(card)
                     player.deck.discard([card])
 
 
@@ -175,7 +175,7 @@ class Sentry(Action):
         deck.draw()
         deck.actions += 1
         cards_to_put_back = []
-        for i, card in enumerate(deck.draw_pile[0:2]):
+        for i, card in enumerate(deck.peek(2)):
             deck.game.out(f"Card {i + 1}/2: {card.name}")
             choice = deck.player.choice(
                 cls, "What do you want to do with it?", ["Trash", "Discard", "Put Back"]
@@ -184,7 +184,7 @@ class Sentry(Action):
             if choice == "Trash":
                 deck.trash(card)
             elif choice == "Discard":
-                deck.hand.append(card)
+                deck.add_to_hand(card)
                 deck.discard([card])
             elif choice == "Put Back":
                 cards_to_put_back.append(card)
@@ -192,10 +192,10 @@ class Sentry(Action):
             first_card = deck.player.choice(
                 cls, "Which card do you want to put back first?", cards_to_put_back
             )
-            deck.draw_pile.insert(0, first_card)
+            deck.put_on_top(first_card)
             if len(cards_to_put_back) > 1:
                 second_card = cards_to_put_back[cards_to_put_back.index(first_card) - 1]
-                deck.draw_pile.insert(0, second_card)
+                deck.put_on_top(second_card)
 
 
 class Artisan(Action):
@@ -208,17 +208,18 @@ class Artisan(Action):
         Gain a card to your hand costing up to 5 Coins.
         Put a card from your hand onto your deck.
         """
-        choices = [card for card in deck.game.available_cards if card.cost <= 5]
-        deck.gain_to_hand(
+        choices = list(deck.game.supply.costing_at_most(5))
+        deck.gain_from_supply(
             deck.player.choice(
                 cls, "Which card would you like to gain to your hand?", choices
-            )
+            ),
+            deck.gain_to_hand,
         )
-        deck.hand.remove(
+        deck.remove_from_hand(
             card := deck.player.choice(
                 cls,
                 "Which card are you going to put on top of your deck from your hand?",
                 deck.hand,
             )
         )
-        deck.draw_pile.insert(0, card)
+        deck.put_on_top(card)
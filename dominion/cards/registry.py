@@ -0,0 +1,90 @@
+"""
+Dense integer ids and precomputed type flags for every card class.
+
+Each card class is registered as it is defined and gets two class attributes:
+`card_id`, its index in the registry, and `type_flags`, a bitmask of the flags below.
+The registry also keeps cost, coin and victory point tables indexed by card id.
+"""
+import array
+import typing as t
+
+if t.TYPE_CHECKING:
+    from dominion.cards.card import Card
+else:
+    Card = None  # pylint: disable=invalid-name
+
+TREASURE = 1 << 0
+ACTION = 1 << 1
+VICTORY = 1 << 2
+CURSE = 1 << 3
+REACTION = 1 << 4
+ATTACK = 1 << 5
+# Victory and Curse cards whose points depend on the deck they are in, like
+# Gardens: any card that overrides `points`.
+VARIABLE_POINTS = 1 << 6
+# Actions and Treasures that keep the generic effect of their type, so they only
+# give the bonuses or coins they declare, like Smithy or Silver.
+VANILLA = 1 << 7
+
+
+def attribute_owner(card: t.Type[Card], name: str) -> type:
+    """The class `card` gets its attribute `name` from."""
+    for base in card.__mro__:
+        if name in base.__dict__:
+            return base
+    return object
+
+
+def effect_owner(card: t.Type[Card]) -> type:
+    """The class `card` gets its `effect` from."""
+    return attribute_owner(card, "effect")
+
+
+class CardRegistry:
+    cards: t.List[t.Type[Card]]
+    ids: t.Dict[str, int]
+    type_flags: "array.array[int]"
+    costs: "array.array[int]"
+    coins: "array.array[int]"
+    points: "array.array[int]"
+
+    def __init__(self) -> None:
+        self.cards = []
+        self.ids = {}
+        self.type_flags = array.array("H")
+        self.costs = array.array("h")
+        self.coins = array.array("h")
+        self.points = array.array("h")
+
+    def register(self, card: t.Type[Card]) -> int:
+        """Assigns `card` the next id and precomputes its flags and static values."""
+        flags = 0
+        # Base classes declare their own flag as `card_type`, subclasses inherit it.
+        for base in card.__mro__:
+            flags |= base.__dict__.get("card_type", 0)
+        # Victory and Curse score their fixed `victory_points`, overrides may not.
+        points_type = attribute_owner(card, "points").__dict__.get("card_type", 0)
+        if flags & (VICTORY | CURSE) and points_type not in (VICTORY, CURSE):
+            flags |= VARIABLE_POINTS
+        generic_type = effect_owner(card).__dict__.get("card_type", 0)
+        if generic_type in (ACTION, TREASURE) and flags & generic_type:
+            flags |= VANILLA
+        card_id = len(self.cards)
+        card.card_id = card_id
+        card.type_flags = flags
+        self.cards.append(card)
+        self.ids.setdefault(f"{card.__module__}.{card.__qualname__}", card_id)
+        self.type_flags.append(flags)
+        self.costs.append(card.cost)
+        self.coins.append(card.coins)
+        self.points.append(card.victory_points if flags & (VICTORY | CURSE) else 0)
+        return card_id
+
+    def __getitem__(self, card_id: int) -> t.Type[Card]:
+        return self.cards[card_id]
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+
+registry = CardRegistry()
@@ -1,6 +1,7 @@
 import typing as t
 
 from .card import BaseCard
+from .registry import TREASURE
 
 if t.TYPE_CHECKING:
     from ..deck import Deck
@@ -10,16 +11,17 @@ else:
     Players = None  # pylint: disable=invalid-name
 
 
-class Treasure(BaseCard):  # pylint: disable=abstract-method
-    pass
+class Treasure(BaseCard):
+    card_type: int = TREASURE
+
+    @classmethod
+    def effect(cls, deck: Deck) -> None:
+        deck.coins += cls.coins
 
 
 class Copper(Treasure):
     name: str = "Copper"
-
-    @classmethod
-    def effect(cls, deck: Deck) -> None:
-        deck.coins += 1
+    coins: int = 1
 
     @classmethod
     def setup(cls, players: Players) -> int:
@@ -30,10 +32,7 @@ class Copper(Treasure):
 class Silver(Treasure):
     name: str = "Silver"
     cost: int = 3
-
-    @classmethod
-    def effect(cls, deck: Deck) -> None:
-        deck.coins += 2
+    coins: int = 2
 
     @classmethod
     def setup(cls, players: Players) -> int:
@@ -44,10 +43,7 @@ class Silver(Treasure):
 class Gold(Treasure):
     name: str = "Gold"
     cost: int = 6
-
-    @classmethod
-    def effect(cls, deck: Deck) -> None:
-        deck.coins += 3
+    coins: int = 3
 
     @classmethod
     def setup(cls, players: Players) -> int:
@@ -2,6 +2,7 @@
 import typing as t
 
 from .card import BaseCard, Card, KingdomCard
+from .registry import VICTORY
 
 if t.TYPE_CHECKING:
     from ..deck import Deck
@@ -12,9 +13,11 @@ else:
 
 
 class Victory(Card):
+    card_type: int = VICTORY
+
     @classmethod
     def points(cls, deck: Deck) -> int:
-        return 0
+        return cls.victory_points
 
     @classmethod
     def setup(cls, players: Players) -> int:
@@ -29,10 +32,7 @@ class Victory(Card):
 class Estate(Victory, BaseCard):
     name: str = "Estate"
     cost: int = 2
-
-    @classmethod
-    def points(cls, deck: Deck) -> int:
-        return 1
+    victory_points: int = 1
 
     @classmethod
     def setup(cls, players: Players) -> int:
@@ -43,10 +43,7 @@ class Estate(Victory, BaseCard):
 class Duchy(Victory, BaseCard):
     name: str = "Duchy"
     cost: int = 5
-
-    @classmethod
-    def points(cls, deck: Deck) -> int:
-        return 3
+    victory_points: int = 3
 
     @classmethod
     def setup(cls, players: Players) -> int:
@@ -57,10 +54,7 @@ class Duchy(Victory, BaseCard):
 class Province(Victory, BaseCard):
     name: str = "Province"
     cost: int = 8
-
-    @classmethod
-    def points(cls, deck: Deck) -> int:
-        return 6
+    victory_points: int = 6
 
     @classmethod
     def setup(cls, players: Players) -> int:
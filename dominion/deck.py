@@ -1,8 +1,10 @@
+import array
+import itertools
 import random
 import typing as t
 
 from dominion.cards.card import Card, CardTypes
-from dominion.cards.curse import Curse
+from dominion.cards.registry import TREASURE, VANILLA, VARIABLE_POINTS, registry
 from dominion.cards.treasure import Copper
 from dominion.cards.victory import Estate, Victory
 from dominion.errors import CardNotFoundError
@@ -11,27 +13,106 @@ from dominion.player import Player
 
 if t.TYPE_CHECKING:
     from .game import Game
+
+    Counts = array.array[int]
 else:
     Game = None  # pylint: disable=invalid-name
+    Counts = array.array
+
+
+class Pile(t.Deque[t.Type[Card]]):
+    """
+    A pile of cards with the top card at index 0.
+
+    A deque, so the top is cheap to take from and put on with `popleft` and
+    `appendleft`. It also takes slices and `pop(index)` like the lists piles used
+    to be, so code that reads `deck.draw_pile[0:2]` keeps working.
+    """
+
+    @t.overload
+    def __getitem__(self, index: t.SupportsIndex) -> t.Type[Card]:
+        ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> CardTypes:
+        ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        return super().__getitem__(index)
+
+    def pop(self, index: t.Optional[int] = None) -> t.Type[Card]:
+        """Takes the card at `index` out of the pile, the bottom one by default."""
+        if index is None:
+            return super().pop()
+        card = self[index]
+        del self[index]
+        return card
+
+
+def count_vector() -> Counts:
+    """A zeroed vector of card counts indexed by card id."""
+    return array.array("H", bytes(2 * len(registry)))
+
+
+# Copied over count vectors to zero them, grown as more cards are registered.
+_zeros = count_vector()
 
 
-class Deck:
-    draw_pile: CardTypes
-    discard_pile: CardTypes
+def clear_counts(counts: Counts) -> None:
+    """Zeroes a count vector in place, without allocating a new one."""
+    if len(counts) > len(_zeros):
+        _zeros.extend(bytes(2 * (len(counts) - len(_zeros))))
+    memoryview(counts)[:] = memoryview(_zeros)[: len(counts)]
+
+
+class Deck:  # pylint: disable=too-many-instance-attributes,too-many-public-methods
+    draw_pile: Pile
+    discard_pile: Pile
     hand: CardTypes
     buys: int
     actions: int
     coins: int
     game: Game
+    # Set by the Player this deck is dealt to.
+    player: Player
+    rng: random.Random
+    card_count: int
+    # Points of the cards whose worth never changes, and counts of those that do.
+    static_points: int
+    variable_point_cards: t.Dict[t.Type[Victory], int]
+    # Card counts indexed by card id, kept in sync with the lists above.
+    # Every card in the deck has a slot, `track` grows them for new card classes.
+    hand_counts: Counts
+    discard_counts: Counts
+    deck_counts: Counts
 
-    def __init__(self, game: Game):
+    def __init__(self, game: Game, rng: t.Optional[random.Random] = None):
         self.game = game
         self.hand = []
-        self.discard_pile = []
+        self.draw_pile = Pile()
+        self.discard_pile = Pile()
+        self.hand_counts = count_vector()
+        self.discard_counts = count_vector()
+        self.deck_counts = count_vector()
+        self.reset(rng)
+
+    def reset(self, rng: t.Optional[random.Random] = None) -> None:
+        """Starts over with a freshly shuffled starting deck, like a new deck would."""
+        self.rng = rng if rng is not None else self.game.rng
+        self.hand.clear()
+        self.draw_pile.clear()
+        self.discard_pile.clear()
+        self.card_count = 0
+        self.static_points = 0
+        self.variable_point_cards = {}
+        for counts in (self.hand_counts, self.discard_counts, self.deck_counts):
+            clear_counts(counts)
         self.buys = 1
         self.actions = 1
         self.coins = 0
-        self.draw_pile = [
+        starting_cards = [
             Copper,
             Copper,
             Copper,
@@ -43,83 +124,270 @@ class Deck:
             Estate,
             Estate,
         ]
-        random.shuffle(self.draw_pile)
+        self.rng.shuffle(starting_cards)
+        self.draw_pile.extend(starting_cards)
+        for card in starting_cards:
+            self.track(card, 1)
         self.draw(5, trigger_reactions=False)
 
     def cleanup(self) -> None:
-        self.discard(self.hand, trigger_reactions=False)
+        # Same as discarding the hand card by card, without the per-card checks.
+        self.discard_pile.extendleft(self.hand)
+        for card in self.hand:
+            self.hand_counts[card.card_id] -= 1
+            self.discard_counts[card.card_id] += 1
+            if self.game.reactive:
+                self.game.reactions.remove(self, card)
+        self.hand.clear()
         self.draw(5, trigger_reactions=False)
 
     def discard(self, cards: CardTypes, trigger_reactions: bool = True) -> None:
         for card in list(cards):
-            if card not in self.hand:
+            if not self.in_hand(card):
                 raise CardNotFoundError(
                     f"Cannot discard this {card.name}, it is not in your hand."
                 )
             if trigger_reactions:
-                self.game.dispatch_event(self, Event.DISCARD_EVENT, card)
-                self.game.log(self, "You discarded", card.name)
-            self.discard_pile.insert(0, self.hand.pop(self.hand.index(card)))
+                if self.game.reactive:
+                    self.game.dispatch_event(self, Event.DISCARD_EVENT, card)
+                if self.game.log_events:
+                    self.game.log(self, "You discarded", card.name)
+            self.discard_pile.appendleft(self.remove_from_hand(card))
+            self.discard_counts[card.card_id] += 1
 
     def gain(self, card: t.Type[Card], trigger_reactions: bool = True) -> t.Type[Card]:
         if trigger_reactions:
-            self.game.dispatch_event(self, Event.GAIN_EVENT, card)
-            self.game.log(self, "You gained a", card.name)
+            if self.game.reactive:
+                self.game.dispatch_event(self, Event.GAIN_EVENT, card)
+            if self.game.log_events:
+                self.game.log(self, "You gained a", card.name)
         self.discard_pile.append(card)
+        self.discard_counts[card.card_id] += 1
+        self.track(card, 1)
         return card
 
+    def gain_from_supply(
+        self,
+        card: t.Type[Card],
+        gain: t.Optional[t.Callable[[t.Type[Card]], t.Type[Card]]] = None,
+    ) -> t.Optional[t.Type[Card]]:
+        """
+        Takes `card` from its supply pile and gains it with `gain`, `gain` itself by
+        default, or gains nothing if the pile is empty.
+        """
+        if not self.game.supply.available(card):
+            return None
+        self.game.supply.take(card)
+        return (gain or self.gain)(card)
+
     def gain_to_hand(
         self, card: t.Type[Card], trigger_reactions: bool = True
     ) -> t.Type[Card]:
         if trigger_reactions:
-            self.game.dispatch_event(self, Event.GAIN_EVENT, card)
-            self.game.log(self, "You gained a", card.name, "to your hand.")
+            if self.game.reactive:
+                self.game.dispatch_event(self, Event.GAIN_EVENT, card)
+            if self.game.log_events:
+                self.game.log(self, "You gained a", card.name, "to your hand.")
+        self.track(card, 1)
+        return self.add_to_hand(card)
+
+    def gain_to_draw_pile(
+        self, card: t.Type[Card], trigger_reactions: bool = True
+    ) -> t.Type[Card]:
+        if trigger_reactions:
+            if self.game.reactive:
+                self.game.dispatch_event(self, Event.GAIN_EVENT, card)
+            if self.game.log_events:
+                self.game.log(self, "You gained a", card.name, "onto your deck.")
+        self.track(card, 1)
+        return self.put_on_top(card)
+
+    def add_to_hand(self, card: t.Type[Card]) -> t.Type[Card]:
+        """Puts a card into the hand, keeping its counts and reactions in step."""
         self.hand.append(card)
+        self.hand_counts[card.card_id] += 1
+        if self.game.reactive:
+            self.game.reactions.add(self, card)
+        return card
+
+    def remove_from_hand(self, card: t.Type[Card]) -> t.Type[Card]:
+        """Takes a card out of the hand, keeping its counts and reactions in step."""
+        if not self.in_hand(card):
+            raise CardNotFoundError(f"There is no {card.name} in your hand.")
+        self.hand.remove(card)
+        self.hand_counts[card.card_id] -= 1
+        if self.game.reactive:
+            self.game.reactions.remove(self, card)
+        return card
+
+    def remove_from_discard_pile(self, card: t.Type[Card]) -> t.Type[Card]:
+        if not self.in_discard_pile(card):
+            raise CardNotFoundError(f"There is no {card.name} in your discard pile.")
+        self.discard_pile.remove(card)
+        self.discard_counts[card.card_id] -= 1
         return card
 
+    def discard_draw_pile(self) -> None:
+        """Puts the whole draw pile into the discard pile."""
+        for card in self.draw_pile:
+            self.discard_counts[card.card_id] += 1
+        self.discard_pile.extend(self.draw_pile)
+        self.draw_pile.clear()
+
+    def in_hand(self, card: t.Type[Card]) -> bool:
+        return (
+            card.card_id < len(self.hand_counts) and self.hand_counts[card.card_id] > 0
+        )
+
+    def in_discard_pile(self, card: t.Type[Card]) -> bool:
+        return (
+            card.card_id < len(self.discard_counts)
+            and self.discard_counts[card.card_id] > 0
+        )
+
+    def count(self, card: t.Type[Card]) -> int:
+        """How many copies of a card the whole deck holds."""
+        if card.card_id < len(self.deck_counts):
+            return self.deck_counts[card.card_id]
+        return 0
+
+    @property
+    def composition(self) -> Counts:
+        """
+        Live counts of every card in the deck, indexed by card id.
+
+        This is the deck's own vector, not a copy: read it, don't modify it.
+        """
+        return self.deck_counts
+
     def trash(self, card: t.Type[Card], trigger_reactions: bool = True) -> t.Type[Card]:
+        """Trashes a card already taken out of the hand or piles."""
         if trigger_reactions:
-            self.game.dispatch_event(self, Event.TRASH_EVENT, card)
-            self.game.log(self, "You trashed a", card.name)
+            if self.game.reactive:
+                self.game.dispatch_event(self, Event.TRASH_EVENT, card)
+            if self.game.log_events:
+                self.game.log(self, "You trashed a", card.name)
         self.game.trash_pile.append(card)
+        self.track(card, -1)
+        return card
+
+    def track(self, card: t.Type[Card], count: int) -> None:
+        """Accounts for `count` copies of a card joining (or leaving) the deck."""
+        if card.card_id >= len(self.deck_counts):
+            for counts in (self.hand_counts, self.discard_counts, self.deck_counts):
+                counts.extend(bytes(2 * (len(registry) - len(counts))))
+        self.card_count += count
+        self.deck_counts[card.card_id] += count
+        if card.type_flags & VARIABLE_POINTS:
+            victory_card = t.cast(t.Type[Victory], card)
+            self.variable_point_cards[victory_card] = (
+                self.variable_point_cards.get(victory_card, 0) + count
+            )
+        else:
+            self.static_points += count * card.victory_points
+
+    def play_treasures(self) -> None:
+        """
+        Plays every Treasure in hand, in one pass.
+
+        Treasures only worth their `coins` are added up from the registry, the
+        effect of any other Treasure is called in hand order.
+        """
+        coins = registry.coins
+        total = 0
+        for card in self.hand:
+            flags = card.type_flags
+            if flags & TREASURE:
+                if flags & VANILLA:
+                    total += coins[card.card_id]
+                else:
+                    self.coins += total
+                    total = 0
+                    card.effect(self)
+        self.coins += total
+
+    def put_on_top(self, card: t.Type[Card]) -> t.Type[Card]:
+        """Puts a card on top of the draw pile."""
+        self.draw_pile.appendleft(card)
         return card
 
+    def peek(self, amount: int = 1) -> CardTypes:
+        """The top `amount` cards of the draw pile, without drawing or reshuffling."""
+        return list(itertools.islice(self.draw_pile, amount))
+
     @property
     def cards(self) -> CardTypes:
-        return self.draw_pile + self.discard_pile + self.hand
+        return [*self.draw_pile, *self.discard_pile, *self.hand]
 
     def draw(self, amount: int = 1, trigger_reactions: bool = True) -> CardTypes:
+        """
+        Draws `amount` cards into the hand, or as many as are left, and returns them.
+
+        Cards are moved a run at a time, the draw pile is only reshuffled when it
+        runs out. Games with a card that reacts to draws draw one card at a time
+        so every draw can be reacted to.
+        """
+        if trigger_reactions and self.game.reacts_to_draws:
+            return self.draw_each(amount)
+        drawn: CardTypes = []
+        pile = self.draw_pile
+        while len(drawn) < amount:
+            if not pile:
+                self.shuffle()
+                if not pile:
+                    break
+            popleft = pile.popleft
+            drawn.extend(
+                [popleft() for _ in range(min(amount - len(drawn), len(pile)))]
+            )
+        self.hand.extend(drawn)
+        counts = self.hand_counts
+        for card in drawn:
+            counts[card.card_id] += 1
+        if self.game.reactive:
+            for card in drawn:
+                self.game.reactions.add(self, card)
+        if trigger_reactions and self.game.log_events:
+            for card in drawn:
+                self.game.log(self, "You drew a", card.name)
+        return drawn
+
+    def draw_each(self, amount: int) -> CardTypes:
+        """Draws cards one by one, dispatching a draw event before each lands in hand."""
+        drawn: CardTypes = []
         for _ in range(amount):
             if not self.draw_pile:
                 self.shuffle()
-            card = self.draw_pile.pop(0)
-            if trigger_reactions:
-                self.game.dispatch_event(self, Event.DRAW_EVENT, card)
+                if not self.draw_pile:
+                    break
+            card = self.draw_pile.popleft()
+            self.game.dispatch_event(self, Event.DRAW_EVENT, card)
+            if self.game.log_events:
                 self.game.log(self, "You drew a", card.name)
-            self.hand.append(card)
-        return self.hand[len(self.hand) - amount : len(self.hand)]
+            drawn.append(self.add_to_hand(card))
+        return drawn
 
     def reveal(self, card: t.Type[Card]) -> t.Type[Card]:
-        if card in self.hand:
-            self.game.dispatch_event(self, Event.REVEAL_EVENT, card)
-            self.game.log(
-                self, f"{self.game.get_player(self).player_id!r} revealed a {card.name}"
-            )
+        if self.in_hand(card):
+            if self.game.reactive:
+                self.game.dispatch_event(self, Event.REVEAL_EVENT, card)
+            if self.game.log_events:
+                self.game.log(self, "Revealed a", card.name)
             return card
         raise CardNotFoundError(f"Cannot reveal {card.name}, it is not in your hand.")
 
     def shuffle(self) -> None:
-        self.draw_pile += random.sample(self.discard_pile, len(self.discard_pile))
-        self.discard_pile = []
-
-    @property
-    def player(self) -> Player:
-        return self.game.get_player(self)
+        self.draw_pile.extend(
+            self.rng.sample(list(self.discard_pile), len(self.discard_pile))
+        )
+        self.discard_pile.clear()
+        clear_counts(self.discard_counts)
 
     @property
-    def score(self):
-        return sum(
-            card.points(self)
-            for card in self.cards
-            if issubclass(card, (Victory, Curse))
+    def score(self) -> int:
+        if not self.variable_point_cards:
+            return self.static_points
+        return self.static_points + sum(
+            count * card.points(self)
+            for card, count in self.variable_point_cards.items()
         )
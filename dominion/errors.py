@@ -36,3 +36,7 @@ class CardNotFoundError(ActionError):
 
 class PlayerNotFoundError(DominionError):
     pass
+
+
+class UnsupportedCardError(DominionError):
+    pass
@@ -1,65 +1,147 @@
-import inspect
+import random
 import sys
 import typing as t
 
 from dominion.cards.action import Reaction
 from dominion.cards.card import Card, CardTypes
 from dominion.cards.curse import Curse
-from dominion.cards.treasure import Copper, Gold, Silver, Treasure
+from dominion.cards.registry import ATTACK
+from dominion.cards.treasure import Copper, Gold, Silver
 from dominion.cards.victory import Duchy, Estate, Province
 from dominion.deck import Deck
 from dominion.errors import PlayerNotFoundError
 from dominion.event import Event
 from dominion.player import Player, Players, PlayerTypes
+from dominion.reactions import REACTION_HANDLERS, ReactionRegistry, reaction_events
 from dominion.report import Report
+from dominion.rng import substream
+from dominion.sink import EventSink, StreamSink
+from dominion.supply import Supply
 
+if t.TYPE_CHECKING:
+    from dominion.metrics import TurnMetrics
+else:
+    TurnMetrics = None  # pylint: disable=invalid-name
 
-class Game:
+
+class Game:  # pylint: disable=too-many-instance-attributes
     trash_pile: CardTypes
-    kingdom_cards: t.Dict[t.Type[Card], int]
-    base_cards: t.Dict[t.Type[Card], int]
+    supply: Supply
+    reactions: ReactionRegistry
+    # Whether any card in this game can react to anything, see `__init__`.
+    reactive: bool
+    # Whether any card in this game reacts to cards being drawn.
+    reacts_to_draws: bool
+    common_random_numbers: bool
     players: Players
+    # Player turns taken so far, over all seats.
+    turns: int
     game_output: t.TextIO
+    sink: EventSink
+    seed: t.Optional[int]
+    rng: random.Random
+    # Measures every deck at the end of each turn when set, see `dominion.metrics`.
+    metrics: t.Optional[TurnMetrics]
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         self,
         players: PlayerTypes,
         kingdom_card_set: CardTypes,
         game_output: t.TextIO = sys.stdout,
         log_events: bool = False,
+        seed: t.Optional[int] = None,
+        rng: t.Optional[random.Random] = None,
+        common_random_numbers: bool = False,
+        sink: t.Optional[EventSink] = None,
+        metrics: t.Optional[TurnMetrics] = None,
     ):
         self.log_events = log_events
+        self.sink = sink if sink is not None else StreamSink(game_output)
+        self.seed = seed
+        # Every shuffle and bot decision draws from this stream, never from `random`.
+        self.rng = rng if rng is not None else random.Random(seed)
+        self.common_random_numbers = common_random_numbers
+        self.metrics = metrics
         self.game_output = game_output
         self.trash_pile = []
-        self.players = [player(Deck(self)) for player in players]
+        self.turns = 0
+        self.reactions = ReactionRegistry()
+        base_cards = [Copper, Silver, Gold, Estate, Duchy, Province, Curse]
+        # Cards only enter decks from the supply, so if none of them reacts to an
+        # event that can happen in this game, decks never need to report their hands
+        # and events are never dispatched. Only Attacks cause attack events.
+        cards: CardTypes = [*kingdom_card_set, *base_cards]
+        events = set().union(*map(reaction_events, cards))
+        if not any(card.type_flags & ATTACK for card in cards):
+            events.discard(Event.ATTACK_EVENT)
+        self.reactive = bool(events)
+        self.reacts_to_draws = Event.DRAW_EVENT in events
+        self.players = [
+            player(Deck(self, deck_rng), seat)
+            for seat, (player, deck_rng) in enumerate(
+                zip(players, self.deck_rngs(len(players)))
+            )
+        ]
         self.out("[INIT] The players have been dealt!")
-        self.kingdom_cards = {
-            card: card.setup(self.players) for card in kingdom_card_set
-        }
-        self.base_cards = {
-            card: card.setup(self.players)
-            for card in [Copper, Silver, Gold, Estate, Duchy, Province, Curse]
-        }
+        self.supply = Supply(
+            {card: card.setup(self.players) for card in kingdom_card_set},
+            {card: card.setup(self.players) for card in base_cards},
+        )
+        self.out("[INIT] The Supply is setup!")
+
+    def deck_rngs(self, seats: int) -> t.List[t.Optional[random.Random]]:
+        """The stream each seat shuffles from, None for the game's own."""
+        if not self.common_random_numbers:
+            return [None] * seats
+        # Each seat shuffles from its own stream, so games sharing a seed deal
+        # every seat the same shuffles whatever the bots decide along the way.
+        deck_seed = self.seed if self.seed is not None else self.rng.getrandbits(64)
+        return [substream(deck_seed, "seat", seat) for seat in range(seats)]
+
+    def reset(
+        self, seed: t.Optional[int] = None, rng: t.Optional[random.Random] = None
+    ) -> None:
+        """
+        Starts the same players over on the same kingdom, reusing every object.
+
+        The game then plays exactly like a new one built with `seed` (or `rng`).
+        Reports of earlier games look at this game, so record them first.
+        """
+        self.seed = seed
+        self.rng = rng if rng is not None else random.Random(seed)
+        self.trash_pile.clear()
+        self.turns = 0
+        self.reactions = ReactionRegistry()
+        for player, deck_rng in zip(self.players, self.deck_rngs(len(self.players))):
+            player.reset(deck_rng)
+        self.out("[INIT] The players have been dealt!")
+        self.supply.reset()
         self.out("[INIT] The Supply is setup!")
 
     @property
-    def supply(self) -> t.Dict[t.Type[Card], int]:
-        return dict(tuple(self.kingdom_cards.items()) + tuple(self.base_cards.items()))
+    def kingdom_cards(self) -> t.Dict[t.Type[Card], int]:
+        return {card: self.supply[card] for card in self.supply.kingdom_cards}
 
     @property
-    def available_cards(self) -> t.List[t.Type[Card]]:
-        return [card for card, count in self.supply.items() if count > 0]
+    def base_cards(self) -> t.Dict[t.Type[Card], int]:
+        return {card: self.supply[card] for card in self.supply.base_cards}
+
+    @property
+    def available_cards(self) -> t.KeysView[t.Type[Card]]:
+        return self.supply.available_cards
 
     @property
     def empty_supply_piles(self) -> t.List[t.Type[Card]]:
-        return [card for card, count in self.base_cards.items() if count == 0] + [
-            card for card, count in self.kingdom_cards.items() if count == 0
-        ]
+        return self.supply.empty_supply_piles
 
     def get_player(self, deck: Deck) -> Player:
-        for player in self.players:
-            if player.deck == deck:
-                return player
+        player = getattr(deck, "player", None)
+        if (
+            player is not None
+            and player.seat < len(self.players)
+            and self.players[player.seat] is player
+        ):
+            return player
         raise PlayerNotFoundError("This deck does not belong to a player!")
 
     def call_reaction_effect(
@@ -70,35 +152,31 @@ class Game:
         *args,
         **kwargs,
     ) -> None:
-        reaction_events = {
-            Event.DRAW_EVENT: card.when_draw,
-            Event.BUY_EVENT: card.when_buy,
-            Event.TRASH_EVENT: card.when_trash,
-            Event.DISCARD_EVENT: card.when_discard,
-            Event.GAIN_EVENT: card.when_gain,
-            Event.ATTACK_EVENT: card.when_attack,
-            Event.REVEAL_EVENT: card.when_reveal,
-        }
-        self.log(player.deck, f"[{event.name}] {args} {kwargs}")
-        if not inspect.isabstract(reaction_events[event]):
+        if self.log_events:
+            self.log(player.deck, f"[{event.name}]", args, kwargs)
+        # Abstract handlers are placeholders, the player gets no choice for them.
+        if event in reaction_events(card):
             if player.choice(
                 card,
                 f"Activate your {card.name} in response to the {card.name}?",
                 [True, False],
             ):
-                reaction_events[event](player.deck, card, *args, **kwargs)  # type: ignore[operator]
+                getattr(card, REACTION_HANDLERS[event])(player.deck, *args, **kwargs)
 
-    def dispatch_event(self, deck: Deck, event: Event, *args, **kwargs) -> None:
-        for player in deck.game.players:
-            for hand_card in player.deck.hand:
-                if issubclass(hand_card, Reaction):
-                    self.call_reaction_effect(player, hand_card, event, *args, **kwargs)
+    def dispatch_event(  # pylint: disable=unused-argument
+        self, deck: Deck, event: Event, *args, **kwargs
+    ) -> None:
+        if not self.reactions.subscribed(event):
+            return
+        for player in self.players:
+            for hand_card in self.reactions.held(player.deck, event):
+                self.call_reaction_effect(player, hand_card, event, *args, **kwargs)
 
     @property
     def ended(self) -> bool:
-        if self.base_cards[Province] == 0:
+        if not self.supply.available(Province):
             return True
-        return len(self.empty_supply_piles) >= 3
+        return self.supply.empty_piles >= 3
 
     def play(self) -> Report:
         break_flag = False
@@ -106,11 +184,12 @@ class Game:
             for player in self.players:
                 player.display_hand()
                 player.action_phase()
-                for card in player.deck.hand:
-                    if issubclass(card, Treasure):
-                        card.effect(player.deck)
+                player.deck.play_treasures()
                 player.buy_phase()
                 player.cleanup_phase()
+                if self.metrics is not None:
+                    self.metrics.record(player, self.turns // len(self.players) + 1)
+                self.turns += 1
                 if self.ended:
                     break_flag = True
                     break
@@ -118,10 +197,17 @@ class Game:
                 break
         return Report(self)
 
-    def log(self, deck: Deck, message: str, *args, **kwargs) -> None:
-        self.out(f"[{self.get_player(deck).player_id}] {message}", *args, **kwargs)
+    def log(self, deck: Deck, message: str, *args: t.Any) -> None:
+        """
+        Logs a message about a player, prefixed with their id.
+
+        Pass the variable parts as `args` rather than formatting them into `message`,
+        they are only turned into text when `log_events` is on.
+        Hot paths should check `log_events` themselves before calling this.
+        """
+        if self.log_events:
+            self.out(f"[{self.get_player(deck).player_id}] {message}", *args)
 
-    def out(self, *args, **kwargs) -> None:
+    def out(self, *args: t.Any) -> None:
         if self.log_events:
-            return print(*args, **kwargs, file=self.game_output)  # type: ignore[arg-type]
-        return None
+            self.sink.emit(" ".join(map(str, args)))
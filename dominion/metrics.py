@@ -0,0 +1,178 @@
+"""
+Per-turn statistics of how decks develop, gathered while games are played.
+
+Pass a `TurnMetrics` to a `Game` and it measures every player's deck at the end of
+each of their turns, keeping running statistics and a histogram per bot, measure
+and turn number. Memory only depends on the number of bots, measures and turns
+followed, never on the number of games, and metrics from different processes
+can be merged.
+"""
+import operator
+import typing as t
+
+from dominion.cards.registry import registry
+from dominion.player import Player
+from dominion.stats import Histogram, RunningStats
+
+if t.TYPE_CHECKING:
+    from dominion.deck import Deck
+else:
+    Deck = None  # pylint: disable=invalid-name
+
+
+def points(deck: Deck) -> float:
+    return deck.score
+
+
+def money(deck: Deck) -> float:
+    """The coins of every Treasure in the deck, added up."""
+    return sum(map(operator.mul, registry.coins, deck.composition))
+
+
+def money_density(deck: Deck) -> float:
+    """The coins a card of the deck is worth on average."""
+    return money(deck) / deck.card_count if deck.card_count else 0.0
+
+
+def cards(deck: Deck) -> float:
+    return deck.card_count
+
+
+class Measure:  # pylint: disable=too-few-public-methods
+    """A number taken from a deck, and the range its histograms cover."""
+
+    name: str
+    function: t.Callable[[Deck], float]
+    low: float
+    high: float
+    bins: int
+
+    def __init__(
+        self,
+        name: str,
+        function: t.Callable[[Deck], float],
+        low: float,
+        high: float,
+        bins: int = 100,
+    ) -> None:
+        self.name = name
+        self.function = function
+        self.low = low
+        self.high = high
+        self.bins = bins
+
+
+MEASURES = (
+    Measure("points", points, -20, 80),
+    Measure("money", money, 0, 100),
+    Measure("money_density", money_density, 0, 3),
+    Measure("cards", cards, 0, 100),
+)
+
+
+class TurnStatistics:
+    """Mean, variance and quantiles of one measure at one turn number."""
+
+    stats: RunningStats
+    histogram: Histogram
+
+    def __init__(self, measure: Measure) -> None:
+        self.stats = RunningStats()
+        self.histogram = Histogram(measure.low, measure.high, measure.bins)
+
+    def add(self, value: float) -> None:
+        self.stats.add(value)
+        self.histogram.add(value)
+
+    def merge(self, other: "TurnStatistics") -> "TurnStatistics":
+        self.stats.merge(other.stats)
+        self.histogram.merge(other.histogram)
+        return self
+
+
+# Statistics of each measure, by turn number counted from 1 (index 0 is unused).
+Curves = t.Dict[str, t.List[TurnStatistics]]
+
+
+class TurnMetrics:
+    """
+    Statistics of every measure at every turn number, per bot.
+
+    Only the first `max_turns` turns of each player are measured.
+    """
+
+    measures: t.Tuple[Measure, ...]
+    max_turns: int
+    bots: t.Dict[t.Type[Player], Curves]
+
+    def __init__(
+        self, measures: t.Sequence[Measure] = MEASURES, max_turns: int = 40
+    ) -> None:
+        self.measures = tuple(measures)
+        self.max_turns = max_turns
+        self.bots = {}
+
+    def curves(self, bot: t.Type[Player]) -> Curves:
+        """The statistics of `bot`, started empty the first time it is seen."""
+        curves = self.bots.get(bot)
+        if curves is None:
+            curves = self.bots[bot] = {
+                measure.name: [
+                    TurnStatistics(measure) for _ in range(self.max_turns + 1)
+                ]
+                for measure in self.measures
+            }
+        return curves
+
+    def record(self, player: Player, turn: int) -> None:
+        """Measures the deck of `player` at the end of their turn number `turn`."""
+        if turn > self.max_turns:
+            return
+        curves = self.curves(player.__class__)
+        for measure in self.measures:
+            curves[measure.name][turn].add(measure.function(player.deck))
+
+    def merge(self, other: "TurnMetrics") -> "TurnMetrics":
+        for bot, their_curves in other.bots.items():
+            curves = self.curves(bot)
+            for name, turns in their_curves.items():
+                for mine, theirs in zip(curves[name], turns):
+                    mine.merge(theirs)
+        return self
+
+    def curve(
+        self, bot: t.Type[Player], measure: str, quantile: t.Optional[float] = None
+    ) -> t.List[float]:
+        """
+        The mean of `measure` (or the given quantile of it) at each turn number
+        from 1, up to the last turn `bot` was measured at, empty for a bot never
+        measured.
+        """
+        curves = self.bots.get(bot)
+        if curves is None:
+            return []
+        turns = curves[measure][1:]
+        while turns and not turns[-1].stats.count:
+            turns.pop()
+        if quantile is None:
+            return [turn.stats.mean for turn in turns]
+        return [turn.histogram.quantile(quantile) for turn in turns]
+
+    def view(self) -> str:
+        lines = []
+        for bot, curves in self.bots.items():
+            lines.append(f"{bot.__qualname__}:")
+            for name, turns in curves.items():
+                lines.append(f"  {name}:")
+                lines.extend(
+                    f"    - turn {number}: {turn.stats.mean:.3g} "
+                    f"± {turn.stats.standard_error:.2g} "
+                    f"(median {turn.histogram.quantile(0.5):.3g}, "
+                    f"n={turn.stats.count})"
+                    for number, turn in enumerate(turns)
+                    if turn.stats.count
+                )
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.view()
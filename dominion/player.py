@@ -1,8 +1,8 @@
+import random
 import typing as t
-import uuid
 
-from dominion.cards.action import Action
 from dominion.cards.card import Card
+from dominion.cards.registry import ACTION
 
 if t.TYPE_CHECKING:
     from dominion.deck import Deck
@@ -21,18 +21,30 @@ class Player:
     """Implements decision logic framework into the game."""
 
     deck: Deck
+    seat: int
     player_id: str
 
-    def __init__(self, deck: Deck):
+    def __init__(self, deck: Deck, seat: int = 0):
         self.deck = deck
-        self.player_id = f"{self.__class__.__qualname__}-{uuid.uuid4()}"
+        deck.player = self
+        self.seat = seat
+        self.player_id = f"{self.__class__.__qualname__}-{seat}"
+
+    def reset(self, rng: t.Optional[random.Random] = None) -> None:
+        """
+        Gets ready for a new game with the same seat, starting the deck over.
+
+        Bots that remember anything between turns should forget it here too.
+        """
+        self.deck.reset(rng)
 
     def display_hand(self) -> None:
-        self.deck.game.log(
-            self.deck,
-            "Your Hand:",
-            *[card.name for card in self.deck.hand],
-        )
+        if self.deck.game.log_events:
+            self.deck.game.log(
+                self.deck,
+                "Your Hand:",
+                *[card.name for card in self.deck.hand],
+            )
 
     def action_phase(self) -> None:
         raise NotImplementedError
@@ -57,7 +69,7 @@ class Human(Player):
 
     def action_phase(self) -> None:
         while self.deck.actions > 0 and (
-            actions := [card for card in self.deck.hand if issubclass(card, Action)]
+            actions := [card for card in self.deck.hand if card.type_flags & ACTION]
         ):
             if target_action := self.choice(
                 None,
@@ -73,11 +85,7 @@ class Human(Player):
             if target_card := self.choice(
                 None,
                 f"Buys: {self.deck.buys}\nWhich card would you like to buy?",
-                [
-                    card
-                    for card in self.deck.game.available_cards
-                    if card.cost <= self.deck.coins
-                ],
+                list(self.deck.game.supply.costing_at_most(self.deck.coins)),
             ):
                 target_card.buy(self.deck)
             else:
@@ -0,0 +1,88 @@
+import typing as t
+
+from dominion.cards.action import Reaction
+from dominion.cards.card import Card
+from dominion.cards.registry import REACTION
+from dominion.event import Event
+
+if t.TYPE_CHECKING:
+    from dominion.deck import Deck
+else:
+    Deck = None  # pylint: disable=invalid-name
+
+
+REACTION_HANDLERS: t.Dict[Event, str] = {
+    Event.DRAW_EVENT: "when_draw",
+    Event.BUY_EVENT: "when_buy",
+    Event.TRASH_EVENT: "when_trash",
+    Event.DISCARD_EVENT: "when_discard",
+    Event.GAIN_EVENT: "when_gain",
+    Event.ATTACK_EVENT: "when_attack",
+    Event.REVEAL_EVENT: "when_reveal",
+}
+
+_reaction_events: t.Dict[t.Type[Card], t.FrozenSet[Event]] = {}
+
+
+def reaction_events(card: t.Type[Card]) -> t.FrozenSet[Event]:
+    """The events `card` implements a reaction to, empty for non-Reaction cards."""
+    try:
+        return _reaction_events[card]
+    except KeyError:
+        pass
+    events: t.FrozenSet[Event] = frozenset()
+    if card.type_flags & REACTION:
+        events = frozenset(
+            event
+            for event, handler in REACTION_HANDLERS.items()
+            if not getattr(getattr(card, handler), "__isabstractmethod__", False)
+        )
+    _reaction_events[card] = events
+    return events
+
+
+class ReactionRegistry:
+    """
+    Tracks which decks hold Reaction cards in hand and which events they react to.
+
+    Decks report every card entering or leaving their hand, so dispatching an event
+    nobody reacts to costs a single lookup.
+    """
+
+    _held: t.Dict[Deck, t.Dict[t.Type[Card], int]]
+    _subscriptions: t.Dict[Event, int]
+
+    def __init__(self) -> None:
+        self._held = {}
+        self._subscriptions = dict.fromkeys(Event, 0)
+
+    def add(self, deck: Deck, card: t.Type[Card]) -> None:
+        events = reaction_events(card)
+        if events:
+            held = self._held.setdefault(deck, {})
+            held[card] = held.get(card, 0) + 1
+            for event in events:
+                self._subscriptions[event] += 1
+
+    def remove(self, deck: Deck, card: t.Type[Card]) -> None:
+        events = reaction_events(card)
+        if events:
+            held = self._held[deck]
+            held[card] -= 1
+            if not held[card]:
+                del held[card]
+            for event in events:
+                self._subscriptions[event] -= 1
+
+    def subscribed(self, event: Event) -> bool:
+        """Whether any hand holds a Reaction to `event`."""
+        return self._subscriptions[event] > 0
+
+    def held(self, deck: Deck, event: Event) -> t.List[t.Type[Reaction]]:
+        """The Reactions to `event` in `deck`'s hand, once per copy."""
+        return [
+            card  # type: ignore[misc]
+            for card, count in self._held.get(deck, {}).items()
+            if event in reaction_events(card)
+            for _ in range(count)
+        ]
@@ -1,63 +1,129 @@
-import functools
+import array
 import typing as t
-from collections import defaultdict
 
 from dominion.cards.card import Card
-from dominion.cards.curse import Curse
-from dominion.cards.victory import Victory
-from dominion.player import Player
+from dominion.cards.registry import registry
+from dominion.player import Player, Players
 
 if t.TYPE_CHECKING:
     from .game import Game
+
+    Counts = array.array[int]
 else:
     Game = None  # pylint: disable=invalid-name
+    Counts = array.array
 
 
-class Report:
+class GameSummary:  # pylint: disable=too-many-instance-attributes
+    """
+    What is left of a finished game once its objects are gone: a few hundred bytes,
+    cheap to pickle between processes and enough to render a `Report` from.
+
+    Cards are stored as registry ids, per-seat values are in seat order.
+    """
+
+    __slots__ = (
+        "seed",
+        "players",
+        "player_ids",
+        "scores",
+        "turns",
+        "decks",
+        "deck_orders",
+        "piles",
+        "pile_counts",
+        "kingdom_size",
+    )
+
+    seed: t.Optional[int]
+    players: t.Tuple[t.Type[Player], ...]
+    player_ids: t.Tuple[str, ...]
+    scores: t.Tuple[int, ...]
+    # Player turns taken, over all seats.
+    turns: int
+    # Each seat's deck composition, indexed by card id.
+    decks: t.Tuple[Counts, ...]
+    # The card ids of each seat's deck in the order they first appear in it.
+    deck_orders: t.Tuple[Counts, ...]
+    # Supply piles in supply order (kingdom cards first) and what was left in them.
+    piles: Counts
+    pile_counts: Counts
+    kingdom_size: int
+
     def __init__(self, game: Game) -> None:
-        self.game = game
+        self.seed = game.seed
+        self.players = tuple(player.__class__ for player in game.players)
+        self.player_ids = tuple(player.player_id for player in game.players)
+        self.scores = tuple(player.deck.score for player in game.players)
+        self.turns = game.turns
+        self.decks = tuple(
+            array.array("H", player.deck.composition) for player in game.players
+        )
+        self.deck_orders = tuple(
+            array.array("H", dict.fromkeys(card.card_id for card in player.deck.cards))
+            for player in game.players
+        )
+        self.piles = array.array("H", (card.card_id for card in game.supply))
+        self.pile_counts = array.array("H", game.supply.values())
+        self.kingdom_size = len(game.supply.kingdom_cards)
 
-    @functools.cached_property
-    def scores(self) -> t.Dict[Player, int]:
+    def __getstate__(self) -> t.Tuple[t.Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: t.Tuple[t.Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+    @property
+    def kingdom(self) -> t.List[t.Type[Card]]:
+        return [registry[card_id] for card_id in self.piles[: self.kingdom_size]]
+
+    @property
+    def supply(self) -> t.Dict[t.Type[Card], int]:
+        """What was left in every supply pile, in supply order."""
         return {
-            player: sum(
-                card.points(player.deck)
-                for card in player.deck.cards
-                if issubclass(card, (Victory, Curse))
-            )
-            for player in self.game.players
+            registry[card_id]: count
+            for card_id, count in zip(self.piles, self.pile_counts)
         }
 
     @property
-    def winners(self) -> t.List[t.Tuple[Player, int]]:
-        max_score = max(self.scores.values())
-        return [
-            (player, score)
-            for player, score in self.scores.items()
-            if score >= max_score
-        ]
+    def empty_piles(self) -> t.List[t.Type[Card]]:
+        return [card for card, count in self.supply.items() if not count]
 
-    @staticmethod
-    def player_deck(player: Player) -> t.Dict[t.Type[Card], int]:
-        total: t.Dict[t.Type[Card], int] = defaultdict(int)
-        for card in player.deck.cards:
-            total[card] += 1
-        return dict(total)
+    @property
+    def winners(self) -> t.List[int]:
+        """The seats with the highest score, ties included."""
+        max_score = max(self.scores)
+        return [seat for seat, score in enumerate(self.scores) if score >= max_score]
+
+    def win_share(self, seat: int) -> float:
+        """1 for an outright win, split evenly between tied winners, else 0."""
+        winners = self.winners
+        if seat in winners:
+            return 1 / len(winners)
+        return 0.0
+
+    def deck(self, seat: int) -> t.Dict[t.Type[Card], int]:
+        """The final deck of `seat`, in the order its cards first appear in it."""
+        counts = self.decks[seat]
+        return {
+            registry[card_id]: counts[card_id] for card_id in self.deck_orders[seat]
+        }
 
     def view(self) -> str:
         scores = "\n".join(
-            f"  - {player.player_id}: {score}" for player, score in self.scores.items()
+            f"  - {player_id}: {score}"
+            for player_id, score in zip(self.player_ids, self.scores)
         )
         supply = "\n".join(
-            f"  - {card.name}: {count}" for card, count in self.game.supply.items()
+            f"  - {card.name}: {count}" for card, count in self.supply.items()
         )
         decks = "\n".join(
-            f"  - [{player.player_id}]: "
+            f"  - [{player_id}]: "
             + ", ".join(
-                f"{card.name}: {count}"
-                for card, count in self.player_deck(player).items()
+                f"{card.name}: {count}" for card, count in self.deck(seat).items()
             )
-            for player in self.game.players
+            for seat, player_id in enumerate(self.player_ids)
         )
         return (
             f"Scores:\n{scores}\n"
@@ -65,5 +131,79 @@ class Report:
             f"Player Decks:\n{decks}"
         )
 
+    def __repr__(self) -> str:
+        return f"<GameSummary players={self.player_ids} scores={self.scores}>"
+
+
+class Report:
+    """
+    The outcome of a game.
+
+    Everything is read from `summary`, taken when the game ended, so a report
+    stays valid after its game is reset for the next one. The game is only kept
+    for `scores` and `winners`, which are keyed by its players: call
+    `discard_game` before keeping many reports around. Pickled reports leave the
+    game behind.
+    """
+
+    summary: GameSummary
+    game: t.Optional[Game]
+
+    def __init__(
+        self, game: t.Optional[Game] = None, summary: t.Optional[GameSummary] = None
+    ) -> None:
+        if summary is None:
+            if game is None:
+                raise ValueError("A report needs a game or its summary.")
+            summary = GameSummary(game)
+        self.summary = summary
+        self.game = game
+
+    def discard_game(self) -> None:
+        """Lets the game go, leaving a report of a few hundred bytes."""
+        self.game = None
+
+    def __getstate__(self) -> t.Dict[str, t.Any]:
+        return {"summary": self.summary, "game": None}
+
+    @property
+    def players(self) -> Players:
+        if self.game is None:
+            raise ValueError("The game of this report was discarded, see `summary`.")
+        return self.game.players
+
+    @property
+    def scores(self) -> t.Dict[Player, int]:
+        return dict(zip(self.players, self.summary.scores))
+
+    @property
+    def winners(self) -> t.List[t.Tuple[Player, int]]:
+        players = self.players
+        return [
+            (players[seat], self.summary.scores[seat]) for seat in self.summary.winners
+        ]
+
+    def win_share(self, player: Player) -> float:
+        """1 for an outright win, split evenly between tied winners, else 0."""
+        return self.summary.win_share(player.seat)
+
+    @staticmethod
+    def player_deck(player: Player) -> t.Dict[t.Type[Card], int]:
+        """
+        What the deck of `player` holds now, which is no longer the final deck once
+        the game is reset. Use `final_deck` for that.
+        """
+        total: t.Dict[t.Type[Card], int] = {}
+        for card in player.deck.cards:
+            total[card] = total.get(card, 0) + 1
+        return total
+
+    def final_deck(self, player: Player) -> t.Dict[t.Type[Card], int]:
+        """The deck of `player` when the game ended, whatever it holds now."""
+        return self.summary.deck(player.seat)
+
+    def view(self) -> str:
+        return self.summary.view()
+
     def __str__(self) -> str:
         return self.view()
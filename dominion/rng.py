@@ -0,0 +1,19 @@
+"""Deterministic random number substreams for reproducible games."""
+import hashlib
+import random
+import typing as t
+
+
+def derive_seed(base_seed: int, *path: t.Union[int, str]) -> int:
+    """
+    Derives the 64-bit seed of the substream at `path` under `base_seed`.
+
+    Substreams depend only on their path, never on which process or in what order
+    they are created, so a sharded run can be replayed one game at a time.
+    """
+    key = ":".join(map(str, (base_seed, *path))).encode()
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+def substream(base_seed: int, *path: t.Union[int, str]) -> random.Random:
+    return random.Random(derive_seed(base_seed, *path))
@@ -0,0 +1,142 @@
+"""
+Declarative buy rules for bots, compiled into a lookup table by coins.
+
+A bot lists the cards it wants in priority order, each with the coins it needs to
+have and any conditions on the game, and buys the first rule that applies:
+
+    class BigMoney(RuleBot):
+        buy_rules = [
+            BuyRule(Province, 8),
+            BuyRule(Duchy, 5, PileBelow(Province, 5)),
+            BuyRule(Gold, 6),
+            BuyRule(Silver, 3),
+        ]
+"""
+# Conditions and rules are callables and records, with no other methods.
+# pylint: disable=too-few-public-methods
+import typing as t
+
+from dominion.cards.card import Card, CardTypes
+from dominion.player import Player
+
+if t.TYPE_CHECKING:
+    from dominion.deck import Deck
+else:
+    Deck = None  # pylint: disable=invalid-name
+
+
+class Condition:
+    """A test on the game a buy rule only applies under."""
+
+    card: t.Type[Card]
+    amount: int
+
+    def __init__(self, card: t.Type[Card], amount: int) -> None:
+        self.card = card
+        self.amount = amount
+
+    def __call__(self, deck: Deck) -> bool:
+        raise NotImplementedError
+
+
+class PileBelow(Condition):
+    """Fewer than `amount` cards left in the supply pile of `card`."""
+
+    def __call__(self, deck: Deck) -> bool:
+        return deck.game.supply.get(self.card, 0) < self.amount
+
+
+class PileAtLeast(Condition):
+    """At least `amount` cards left in the supply pile of `card`."""
+
+    def __call__(self, deck: Deck) -> bool:
+        return deck.game.supply.get(self.card, 0) >= self.amount
+
+
+class CountBelow(Condition):
+    """Fewer than `amount` copies of `card` in the deck."""
+
+    def __call__(self, deck: Deck) -> bool:
+        return deck.count(self.card) < self.amount
+
+
+class CountAtLeast(Condition):
+    """At least `amount` copies of `card` in the deck."""
+
+    def __call__(self, deck: Deck) -> bool:
+        return deck.count(self.card) >= self.amount
+
+
+class BuyRule:
+    """Buy `card` with at least `coins` (never less than its cost) if all conditions hold."""
+
+    card: t.Type[Card]
+    coins: int
+    conditions: t.Tuple[Condition, ...]
+
+    def __init__(self, card: t.Type[Card], coins: int, *conditions: Condition) -> None:
+        self.card = card
+        self.coins = max(coins, card.cost)
+        self.conditions = conditions
+
+    def applies(self, deck: Deck) -> bool:
+        return deck.game.supply.available(self.card) and all(
+            condition(deck) for condition in self.conditions
+        )
+
+
+BuyTable = t.List[t.Tuple[BuyRule, ...]]
+
+
+def compile_buy_rules(rules: t.Sequence[BuyRule]) -> BuyTable:
+    """
+    The affordable rules for each amount of coins, in priority order.
+
+    Indexing by coins skips every rule the bot can't afford without testing it,
+    more coins than the priciest rule use the last entry.
+    """
+    max_coins = max((rule.coins for rule in rules), default=0)
+    return [
+        tuple(rule for rule in rules if rule.coins <= coins)
+        for coins in range(max_coins + 1)
+    ]
+
+
+class RuleBot(Player):
+    """
+    A bot that plays the first Action of `play_priority` it holds while it has
+    actions, then buys by `buy_rules` while it has buys.
+    """
+
+    buy_rules: t.ClassVar[t.List[BuyRule]] = []
+    play_priority: t.ClassVar[CardTypes] = []
+    buy_table: t.ClassVar[BuyTable] = [()]
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.buy_table = compile_buy_rules(cls.buy_rules)
+
+    def action_phase(self) -> None:
+        while self.deck.actions > 0:
+            for card in self.play_priority:
+                if self.deck.in_hand(card):
+                    card.play(self.deck)
+                    break
+            else:
+                return
+
+    def choose_buy(self) -> t.Optional[t.Type[Card]]:
+        """The card the first applicable rule buys with the coins in hand, if any."""
+        if self.deck.coins < 0:
+            return None
+        for rule in self.buy_table[min(self.deck.coins, len(self.buy_table) - 1)]:
+            if rule.applies(self.deck):
+                return rule.card
+        return None
+
+    def buy_phase(self) -> None:
+        while self.deck.buys > 0:
+            card = self.choose_buy()
+            if card is None:
+                return
+            card.buy(self.deck)
@@ -0,0 +1,33 @@
+"""Destinations for the messages a game logs."""
+import typing as t
+
+
+class EventSink:  # pylint: disable=too-few-public-methods
+    """Receives every message a game logs while `log_events` is on."""
+
+    def emit(self, message: str) -> None:
+        raise NotImplementedError
+
+
+class StreamSink(EventSink):  # pylint: disable=too-few-public-methods
+    """Writes each message as a line of text to a stream."""
+
+    stream: t.TextIO
+
+    def __init__(self, stream: t.TextIO) -> None:
+        self.stream = stream
+
+    def emit(self, message: str) -> None:
+        print(message, file=self.stream)
+
+
+class ListSink(EventSink):  # pylint: disable=too-few-public-methods
+    """Keeps every message in memory, in order."""
+
+    messages: t.List[str]
+
+    def __init__(self) -> None:
+        self.messages = []
+
+    def emit(self, message: str) -> None:
+        self.messages.append(message)
@@ -0,0 +1,231 @@
+"""Online, mergeable statistics over streams of finished games."""
+import math
+import typing as t
+
+from dominion.player import Player
+from dominion.report import Report
+
+
+class RunningStats:
+    """Count, mean and variance of a stream of numbers (Welford's algorithm)."""
+
+    count: int
+    mean: float
+    sum_of_squares: float
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.sum_of_squares = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.sum_of_squares += delta * (value - self.mean)
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        """Combines two streams exactly (Chan et al.'s parallel update)."""
+        if other.count:
+            count = self.count + other.count
+            delta = other.mean - self.mean
+            self.mean += delta * other.count / count
+            self.sum_of_squares += (
+                other.sum_of_squares + delta**2 * self.count * other.count / count
+            )
+            self.count = count
+        return self
+
+    @property
+    def variance(self) -> float:
+        if self.count < 2:
+            return 0.0
+        return self.sum_of_squares / (self.count - 1)
+
+    @property
+    def standard_error(self) -> float:
+        if not self.count:
+            return 0.0
+        return math.sqrt(self.variance / self.count)
+
+
+class Histogram:
+    """
+    Counts of a stream of numbers in equal-width bins over [`low`, `high`), for
+    quantiles in constant memory. Values outside the range land in the end bins.
+    """
+
+    low: float
+    high: float
+    counts: t.List[int]
+
+    def __init__(self, low: float, high: float, bins: int) -> None:
+        self.low = low
+        self.high = high
+        self.counts = [0] * bins
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def add(self, value: float) -> None:
+        bins = len(self.counts)
+        index = int((value - self.low) * bins / (self.high - self.low))
+        self.counts[min(max(index, 0), bins - 1)] += 1
+
+    def merge(self, other: "Histogram") -> "Histogram":
+        if (other.low, other.high, len(other.counts)) != (
+            self.low,
+            self.high,
+            len(self.counts),
+        ):
+            raise ValueError("Only histograms with the same bins can be merged.")
+        self.counts = [mine + theirs for mine, theirs in zip(self.counts, other.counts)]
+        return self
+
+    def quantile(self, fraction: float) -> float:
+        """
+        The value below which `fraction` of the stream falls, interpolated within
+        its bin, so within one bin width of the exact quantile.
+        """
+        total = self.count
+        if not total:
+            return math.nan
+        width = (self.high - self.low) / len(self.counts)
+        target = fraction * total
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= target:
+                return self.low + width * (index + (target - seen) / count)
+            seen += count
+        return self.high
+
+
+class MatchStatistics:
+    """Head-to-head record and score margins of `first` against `second`."""
+
+    first: t.Type[Player]
+    second: t.Type[Player]
+    wins: int
+    draws: int
+    losses: int
+    margins: RunningStats
+
+    def __init__(self, first: t.Type[Player], second: t.Type[Player]) -> None:
+        self.first = first
+        self.second = second
+        self.wins = 0
+        self.draws = 0
+        self.losses = 0
+        self.margins = RunningStats()
+
+    def record(self, report: Report) -> None:
+        """Compares the scores of the first player of each class in the game."""
+        summary = report.summary
+        scores: t.Dict[t.Type[Player], int] = {}
+        for player, score in zip(summary.players, summary.scores):
+            scores.setdefault(player, score)
+        margin = scores[self.first] - scores[self.second]
+        if margin > 0:
+            self.wins += 1
+        elif margin < 0:
+            self.losses += 1
+        else:
+            self.draws += 1
+        self.margins.add(margin)
+
+    def merge(self, other: "MatchStatistics") -> "MatchStatistics":
+        self.wins += other.wins
+        self.draws += other.draws
+        self.losses += other.losses
+        self.margins.merge(other.margins)
+        return self
+
+    @property
+    def games(self) -> int:
+        return self.wins + self.draws + self.losses
+
+    def view(self) -> str:
+        return (
+            f"{self.first.__qualname__} vs {self.second.__qualname__}: "
+            f"{self.wins}W {self.draws}D {self.losses}L, "
+            f"margin {self.margins.mean:+.2f} (std. error {self.margins.standard_error:.2f})"
+        )
+
+
+class SequentialTest:
+    """
+    A two-sided sequential probability ratio test on decisive head-to-head games.
+
+    Runs Wald's test of "evenly matched" (`first` wins a decisive game with
+    probability 1/2) against "`first` is better" (1/2 + `delta`), and another
+    against "`second` is better" (1/2 - `delta`). The run settles once either
+    better bot is accepted, or once both tests accept that the bots are evenly
+    matched. Evenly matched bots are named the winner with probability at most
+    `alpha`, and a bot better by `delta` is missed with probability at most
+    `beta`. Draws carry no evidence and are skipped.
+    """
+
+    alpha: float
+    beta: float
+    delta: float
+    min_games: int
+
+    def __init__(
+        self,
+        alpha: float = 0.05,
+        delta: float = 0.05,
+        min_games: int = 0,
+        beta: float = 0.1,
+    ) -> None:
+        if not 0 < alpha < 0.5:
+            raise ValueError("alpha must be between 0 and 0.5")
+        if not 0 < beta < 0.5:
+            raise ValueError("beta must be between 0 and 0.5")
+        if not 0 < delta < 0.5:
+            raise ValueError("delta must be between 0 and 0.5")
+        self.alpha = alpha
+        self.beta = beta
+        self.delta = delta
+        self.min_games = min_games
+
+    @property
+    def upper(self) -> float:
+        """The log likelihood ratio at which a better bot is accepted."""
+        return math.log((1 - self.beta) / (self.alpha / 2))
+
+    @property
+    def lower(self) -> float:
+        """The log likelihood ratio at which evenly matched bots are accepted."""
+        return math.log(self.beta / (1 - self.alpha / 2))
+
+    def log_likelihood_ratios(
+        self, statistics: MatchStatistics
+    ) -> t.Tuple[float, float]:
+        """The evidence for `first` and for `second` being better, against a tie."""
+        more, less = math.log(1 + 2 * self.delta), math.log(1 - 2 * self.delta)
+        wins, losses = statistics.wins, statistics.losses
+        return wins * more + losses * less, losses * more + wins * less
+
+    def settled(self, statistics: MatchStatistics) -> bool:
+        """Whether the test has reached a decision, a better bot or none."""
+        if statistics.games < self.min_games:
+            return False
+        first, second = self.log_likelihood_ratios(statistics)
+        return max(first, second) >= self.upper or (
+            first <= self.lower and second <= self.lower
+        )
+
+    def decision(self, statistics: MatchStatistics) -> t.Optional[t.Type[Player]]:
+        """
+        The significantly better bot, or None while the test should go on or once
+        it has accepted that the bots are evenly matched.
+        """
+        if statistics.games < self.min_games:
+            return None
+        first, second = self.log_likelihood_ratios(statistics)
+        if first >= self.upper:
+            return statistics.first
+        if second >= self.upper:
+            return statistics.second
+        return None
@@ -0,0 +1,320 @@
+"""
+Keep the summaries of many games on disk as fixed-width columns.
+
+A store is a directory with a `schema.json` and one raw little-endian file per
+column, one row per game:
+
+    seed     uint64                       the game's seed, see `seeded`
+    seeded   uint8                        whether the game had a seed at all
+    bots     uint16 (players,)            bot ids by seat, NO_ID past the last seat
+    kingdom  uint16 (kingdom_size,)       kingdom card ids in supply order, NO_ID padded
+    scores   int16  (players,)            final scores by seat
+    turns    uint16                       player turns taken, over all seats
+    decks    uint16 (players, card_slots) final deck counts by seat and card id
+
+Card and bot ids index the `cards` and `bots` lists of the schema, which name
+them, so rows can be read back without the code that wrote them. Cards are
+matched by name rather than registry id, as registry ids depend on the order
+card classes were defined in by each writer. Games seeded outside of
+0 <= seed < 2**64 are refused. Every column can be opened with `numpy.memmap`
+as is, see `ResultStore.column`.
+
+Appends take an exclusive `flock` on the store, so any number of worker processes
+can append to the same store. Readers only see whole rows, and never need a lock.
+
+Requires the optional `numpy` dependency (`pip install pydominion[batch]`).
+"""
+import fcntl
+import json
+import os
+import typing as t
+
+import numpy as np
+
+from dominion.cards.card import Card
+from dominion.cards.registry import registry
+from dominion.player import Player
+from dominion.report import GameSummary
+
+# Marks an unused seat or kingdom slot.
+NO_ID = 0xFFFF
+
+SCHEMA_VERSION = 1
+
+
+def qualified_name(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+Layout = t.Dict[str, t.Tuple[str, t.Tuple[int, ...]]]
+
+
+def column_layout(max_players: int, kingdom_size: int, card_slots: int) -> Layout:
+    """The dtype and row shape of every column."""
+    return {
+        "seed": ("<u8", ()),
+        "seeded": ("u1", ()),
+        "bots": ("<u2", (max_players,)),
+        "kingdom": ("<u2", (kingdom_size,)),
+        "scores": ("<i2", (max_players,)),
+        "turns": ("<u2", ()),
+        "decks": ("<u2", (max_players, card_slots)),
+    }
+
+
+class CardIds:  # pylint: disable=too-few-public-methods
+    """
+    Translates registry card ids into the ids of a store.
+
+    Registry ids follow the order card classes are defined in, which can differ
+    between the processes writing to a store, so cards are matched by name and
+    cards new to the store are named in `cards`, up to `card_slots` of them.
+    """
+
+    cards: t.List[str]
+    card_slots: int
+    ids: t.Dict[int, int]
+
+    def __init__(self, cards: t.List[str], card_slots: int) -> None:
+        self.cards = cards
+        self.card_slots = card_slots
+        self.ids = {}
+
+    def __getitem__(self, card_id: int) -> int:
+        store_id = self.ids.get(card_id)
+        if store_id is None:
+            name = qualified_name(registry[card_id])
+            if name not in self.cards:
+                if len(self.cards) >= self.card_slots:
+                    raise ValueError(
+                        f"No room for {name} in a store of {self.card_slots} cards."
+                    )
+                self.cards.append(name)
+            store_id = self.ids[card_id] = self.cards.index(name)
+        return store_id
+
+
+def check_fits(summary: GameSummary, max_players: int, kingdom_size: int) -> None:
+    """Raises ValueError unless `summary` fits columns of the given widths."""
+    seats = len(summary.players)
+    if seats > max_players:
+        raise ValueError(
+            f"A game with {seats} players does not fit a store of {max_players}."
+        )
+    if summary.kingdom_size > kingdom_size:
+        raise ValueError(
+            f"A kingdom of {summary.kingdom_size} cards does not fit a store "
+            f"of {kingdom_size}."
+        )
+    if summary.seed is not None and not 0 <= summary.seed < 2**64:
+        raise ValueError(
+            f"Seed {summary.seed} does not fit the unsigned 64-bit seed column."
+        )
+
+
+def encode(
+    summaries: t.Sequence[GameSummary],
+    bots: t.List[str],
+    card_ids: CardIds,
+    max_players: int,
+    kingdom_size: int,
+) -> t.Dict[str, np.ndarray]:
+    """
+    The column values of `summaries`, in columns of the given widths.
+
+    Bots get their index in `bots` as id, and are added to it if missing.
+    """
+    rows = {
+        name: np.zeros((len(summaries), *shape), dtype=dtype)
+        for name, (dtype, shape) in column_layout(
+            max_players, kingdom_size, card_ids.card_slots
+        ).items()
+    }
+    rows["bots"][:] = NO_ID
+    rows["kingdom"][:] = NO_ID
+    for row, summary in enumerate(summaries):
+        check_fits(summary, max_players, kingdom_size)
+        rows["seed"][row] = summary.seed or 0
+        rows["seeded"][row] = summary.seed is not None
+        for seat, player in enumerate(summary.players):
+            name = qualified_name(player)
+            if name not in bots:
+                bots.append(name)
+            rows["bots"][row, seat] = bots.index(name)
+            for card_id, count in enumerate(summary.decks[seat]):
+                if count:
+                    rows["decks"][row, seat, card_ids[card_id]] = count
+        for slot, card_id in enumerate(summary.piles[: summary.kingdom_size]):
+            rows["kingdom"][row, slot] = card_ids[card_id]
+        rows["scores"][row, : len(summary.players)] = summary.scores
+        rows["turns"][row] = summary.turns
+    return rows
+
+
+class ResultStore:
+    """An append-only, memory-mappable table of game summaries."""
+
+    path: str
+    max_players: int
+    kingdom_size: int
+    # How many different cards the deck column has room for.
+    card_slots: int
+    # Qualified names of the cards and bots behind each id.
+    cards: t.List[str]
+    bots: t.List[str]
+
+    def __init__(
+        self,
+        path: str,
+        max_players: int = 4,
+        kingdom_size: int = 10,
+        card_slots: t.Optional[int] = None,
+    ) -> None:
+        """
+        Opens the store in directory `path`, creating it if needed.
+
+        `max_players`, `kingdom_size` and `card_slots` fix the width of the columns
+        of a new store, an existing store keeps its own. By default a store has
+        room for every card registered now and 32 more.
+        """
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        with self.locked():
+            if os.path.exists(self.schema_path):
+                self.load_schema()
+            else:
+                self.max_players = max_players
+                self.kingdom_size = kingdom_size
+                self.cards = [qualified_name(registry[i]) for i in range(len(registry))]
+                self.card_slots = (
+                    card_slots if card_slots is not None else len(self.cards) + 32
+                )
+                self.bots = []
+                self.save_schema()
+
+    @property
+    def schema_path(self) -> str:
+        return os.path.join(self.path, "schema.json")
+
+    @property
+    def columns(self) -> Layout:
+        return column_layout(self.max_players, self.kingdom_size, self.card_slots)
+
+    def column_path(self, name: str) -> str:
+        return os.path.join(self.path, f"{name}.bin")
+
+    def row_size(self, name: str) -> int:
+        dtype, shape = self.columns[name]
+        return np.dtype(dtype).itemsize * int(np.prod(shape, dtype=int))
+
+    def load_schema(self) -> None:
+        with open(self.schema_path, encoding="utf-8") as schema_file:
+            schema = json.load(schema_file)
+        if schema["version"] != SCHEMA_VERSION:
+            raise ValueError(f"Unsupported result store version {schema['version']}.")
+        self.max_players = schema["max_players"]
+        self.kingdom_size = schema["kingdom_size"]
+        self.card_slots = schema["card_slots"]
+        self.cards = schema["cards"]
+        self.bots = schema["bots"]
+
+    def save_schema(self) -> None:
+        schema = {
+            "version": SCHEMA_VERSION,
+            "max_players": self.max_players,
+            "kingdom_size": self.kingdom_size,
+            "card_slots": self.card_slots,
+            "columns": {
+                name: {"dtype": dtype, "shape": shape}
+                for name, (dtype, shape) in self.columns.items()
+            },
+            "cards": self.cards,
+            "bots": self.bots,
+        }
+        # Replaced in one go, so readers never see half a schema.
+        temporary = f"{self.schema_path}.{os.getpid()}"
+        with open(temporary, "w", encoding="utf-8") as schema_file:
+            json.dump(schema, schema_file, indent=2)
+        os.replace(temporary, self.schema_path)
+
+    def locked(self) -> "StoreLock":
+        return StoreLock(os.path.join(self.path, ".lock"))
+
+    def __len__(self) -> int:
+        """The number of whole rows in every column."""
+        lengths = []
+        for name in self.columns:
+            path = self.column_path(name)
+            size = os.path.getsize(path) if os.path.exists(path) else 0
+            lengths.append(size // self.row_size(name))
+        return min(lengths)
+
+    def card_id(self, card: t.Type[Card]) -> int:
+        """The id `card` is stored under."""
+        return self.cards.index(qualified_name(card))
+
+    def bot_id(self, bot: t.Type[Player]) -> int:
+        """The id `bot` is stored under, ValueError if no stored game has it."""
+        return self.bots.index(qualified_name(bot))
+
+    def append(self, summaries: t.Sequence[GameSummary]) -> None:
+        """Adds a row per summary, atomically with respect to other writers."""
+        if not summaries:
+            return
+        with self.locked():
+            # Other writers may have added bots or cards since this store was opened.
+            self.load_schema()
+            named = len(self.bots), len(self.cards)
+            rows = encode(
+                summaries,
+                self.bots,
+                CardIds(self.cards, self.card_slots),
+                self.max_players,
+                self.kingdom_size,
+            )
+            if (len(self.bots), len(self.cards)) != named:
+                self.save_schema()
+            # Drops whatever a writer that died midway left past the last whole row.
+            length = len(self)
+            for name, values in rows.items():
+                with open(self.column_path(name), "ab") as column_file:
+                    column_file.truncate(length * self.row_size(name))
+                    column_file.write(values.tobytes())
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        A read-only view of the whole rows of a column, mapped rather than read.
+
+        Its first axis is the game, the others are the row shape of the column.
+        Reloads the schema first, so `bots` names every bot in the rows returned.
+        """
+        self.load_schema()
+        dtype, shape = self.columns[name]
+        length = len(self)
+        if not length:
+            # Empty files can't be mapped.
+            return np.zeros((0, *shape), dtype=dtype)
+        return np.memmap(
+            self.column_path(name), dtype=dtype, mode="r", shape=(length, *shape)
+        )
+
+
+class StoreLock:
+    """An exclusive `flock` on a file, held within a `with` block."""
+
+    path: str
+    fd: int
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.fd = -1
+
+    def __enter__(self) -> "StoreLock":
+        self.fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc_info: t.Any) -> None:
+        fcntl.flock(self.fd, fcntl.LOCK_UN)
+        os.close(self.fd)
+        self.fd = -1
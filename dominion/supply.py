@@ -0,0 +1,102 @@
+import typing as t
+
+from dominion.cards.card import Card
+from dominion.errors import EmptySupplyPileError
+
+Pile = t.Tuple[t.Type[Card], ...]
+
+
+# pylint: disable-next=too-many-instance-attributes
+class Supply(t.Mapping[t.Type[Card], int]):
+    """
+    The supply piles of a game, kept indexed as cards are bought.
+
+    Maps every card in the supply to the number left in its pile, kingdom cards
+    first, and answers "is this pile non-empty" and "which available cards cost
+    at most / at least N coins" without scanning the piles.
+    """
+
+    kingdom_cards: Pile
+    base_cards: Pile
+    empty_piles: int
+    _setup: t.Dict[t.Type[Card], int]
+    _counts: t.Dict[t.Type[Card], int]
+    _available: t.Dict[t.Type[Card], None]
+    _costing_at_most: t.List[Pile]
+    _costing_at_least: t.List[Pile]
+
+    def __init__(
+        self,
+        kingdom_cards: t.Dict[t.Type[Card], int],
+        base_cards: t.Dict[t.Type[Card], int],
+    ) -> None:
+        self.kingdom_cards = tuple(kingdom_cards)
+        self.base_cards = tuple(base_cards)
+        self._setup = {**kingdom_cards, **base_cards}
+        self.reset()
+
+    def reset(self) -> None:
+        """Refills every pile to its starting size."""
+        self._counts = dict(self._setup)
+        # An insertion ordered dict doubles as an ordered set of non-empty piles.
+        self._available = {card: None for card, count in self._counts.items() if count}
+        self.empty_piles = len(self._counts) - len(self._available)
+        self._index_costs()
+
+    def _index_costs(self) -> None:
+        max_cost = max((card.cost for card in self._counts), default=0)
+        self._costing_at_most = [
+            tuple(card for card in self._available if card.cost <= cost)
+            for cost in range(max_cost + 1)
+        ]
+        self._costing_at_least = [
+            tuple(card for card in self._available if card.cost >= cost)
+            for cost in range(max_cost + 1)
+        ]
+
+    def __getitem__(self, card: t.Type[Card]) -> int:
+        return self._counts[card]
+
+    def __iter__(self) -> t.Iterator[t.Type[Card]]:
+        return iter(self._counts)
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def available(self, card: t.Type[Card]) -> bool:
+        """Whether `card` has a non-empty pile in the supply."""
+        return card in self._available
+
+    @property
+    def available_cards(self) -> t.KeysView[t.Type[Card]]:
+        """Live view of the cards with non-empty piles, in supply order."""
+        return self._available.keys()
+
+    @property
+    def empty_supply_piles(self) -> t.List[t.Type[Card]]:
+        return [card for card in self._counts if not self._counts[card]]
+
+    def costing_at_most(self, cost: int) -> Pile:
+        """Available cards costing `cost` coins or less, in supply order."""
+        if cost < 0:
+            return ()
+        return self._costing_at_most[min(cost, len(self._costing_at_most) - 1)]
+
+    def costing_at_least(self, cost: int) -> Pile:
+        """Available cards costing `cost` coins or more, in supply order."""
+        if cost >= len(self._costing_at_least):
+            return ()
+        return self._costing_at_least[max(cost, 0)]
+
+    def take(self, card: t.Type[Card]) -> t.Type[Card]:
+        """Removes one `card` from its pile."""
+        if card not in self._available:
+            if card in self._counts:
+                raise EmptySupplyPileError(f"Cannot take a {card.name}, none are left.")
+            raise EmptySupplyPileError(f"There is no {card.name} pile in the supply.")
+        self._counts[card] -= 1
+        if not self._counts[card]:
+            del self._available[card]
+            self.empty_piles += 1
+            self._index_costs()
+        return card
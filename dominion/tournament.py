@@ -0,0 +1,516 @@
+"""Play large batches of games between the same players, optionally in parallel."""
+import collections
+import concurrent.futures
+import functools
+import itertools
+import os
+import typing as t
+
+from dominion.cards.card import CardTypes
+from dominion.game import Game
+from dominion.metrics import TurnMetrics
+from dominion.player import Player, PlayerTypes
+from dominion.report import Report
+from dominion.rng import derive_seed
+from dominion.stats import MatchStatistics, SequentialTest
+
+if t.TYPE_CHECKING:
+    from dominion.store import ResultStore
+else:
+    ResultStore = None  # pylint: disable=invalid-name
+
+Seating = t.Tuple[t.Type[Player], ...]
+
+
+class TournamentResult:  # pylint: disable=too-many-instance-attributes
+    """Win tallies for a batch of games, mergeable across workers."""
+
+    wins: t.Dict[t.Type[Player], int]
+    games: int
+    rotation_wins: t.Dict[Seating, t.Dict[t.Type[Player], int]]
+    rotation_games: t.Dict[Seating, int]
+    statistics: t.Optional[MatchStatistics]
+    # Per-turn deck statistics, if the games were played with them.
+    metrics: t.Optional[TurnMetrics]
+    planned_games: int
+    # Whether a sequential test ended the run, and the better bot it named if any.
+    stopped: bool
+    decision: t.Optional[t.Type[Player]]
+
+    def __init__(self, players: PlayerTypes) -> None:
+        self.wins = {player: 0 for player in players}
+        self.games = 0
+        self.rotation_wins = {}
+        self.rotation_games = {}
+        # Head-to-head statistics between the first two distinct bots, if any.
+        contenders = list(self.wins)
+        self.statistics = (
+            MatchStatistics(contenders[0], contenders[1])
+            if len(contenders) >= 2
+            else None
+        )
+        self.metrics = None
+        self.planned_games = 0
+        self.stopped = False
+        self.decision = None
+
+    def record(self, report: Report) -> None:
+        """Counts every winner of a game, ties included, overall and per seating."""
+        summary = report.summary
+        seating = summary.players
+        rotation = self.rotation_wins.setdefault(seating, dict.fromkeys(seating, 0))
+        self.games += 1
+        self.rotation_games[seating] = self.rotation_games.get(seating, 0) + 1
+        for seat in summary.winners:
+            self.wins[seating[seat]] += 1
+            rotation[seating[seat]] += 1
+        if self.statistics is not None:
+            self.statistics.record(report)
+
+    def merge(self, other: "TournamentResult") -> "TournamentResult":
+        for player, wins in other.wins.items():
+            self.wins[player] = self.wins.get(player, 0) + wins
+        self.games += other.games
+        for seating, rotation in other.rotation_wins.items():
+            merged = self.rotation_wins.setdefault(seating, dict.fromkeys(seating, 0))
+            for player, wins in rotation.items():
+                merged[player] += wins
+            self.rotation_games[seating] = (
+                self.rotation_games.get(seating, 0) + other.rotation_games[seating]
+            )
+        if self.statistics is not None and other.statistics is not None:
+            self.statistics.merge(other.statistics)
+        if other.metrics is not None:
+            if self.metrics is None:
+                self.metrics = TurnMetrics(
+                    other.metrics.measures, other.metrics.max_turns
+                )
+            self.metrics.merge(other.metrics)
+        return self
+
+    @property
+    def games_saved(self) -> int:
+        """Games an early stop spared out of those the run was planned for."""
+        return max(0, self.planned_games - self.games)
+
+    def win_rate(
+        self, player: t.Type[Player], seating: t.Optional[Seating] = None
+    ) -> float:
+        """Fraction of games `player` won (ties included), optionally in one seating."""
+        if seating is None:
+            wins, games = self.wins.get(player, 0), self.games
+        else:
+            wins = self.rotation_wins.get(seating, {}).get(player, 0)
+            games = self.rotation_games.get(seating, 0)
+        return wins / games if games else 0.0
+
+    def view(self) -> str:
+        rotations = "\n".join(
+            f"  - {' / '.join(player.__qualname__ for player in seating)} "
+            f"({self.rotation_games[seating]} games): "
+            + ", ".join(
+                f"{player.__qualname__}: {self.win_rate(player, seating):.4f}"
+                for player in rotation
+            )
+            for seating, rotation in self.rotation_wins.items()
+        )
+        combined = "\n".join(
+            f"  - {player.__qualname__}: {wins} ({self.win_rate(player):.4f})"
+            for player, wins in self.wins.items()
+        )
+        summary = f"Games: {self.games}\n"
+        if self.decision is not None:
+            summary += (
+                f"Stopped early, {self.decision.__qualname__} is significantly better "
+                f"({self.games_saved} games saved)\n"
+            )
+        elif self.stopped:
+            summary += (
+                "Stopped early, no significant difference "
+                f"({self.games_saved} games saved)\n"
+            )
+        if self.statistics is not None:
+            summary += f"Head to head: {self.statistics.view()}\n"
+        return (
+            f"{summary}"
+            f"Win rates by seating:\n{rotations}\n"
+            f"Combined wins:\n{combined}"
+        )
+
+    def __str__(self) -> str:
+        return self.view()
+
+    def __repr__(self) -> str:
+        return f"<TournamentResult games={self.games} wins={self.wins}>"
+
+
+class Comparison:
+    """
+    Paired win shares of a candidate and a baseline bot seated against the same field.
+
+    Both games of a pair share their seed and deal each seat the same shuffles,
+    so the per-pair difference cancels most of the luck of the draw.
+    """
+
+    pairs: int
+    candidate_total: float
+    baseline_total: float
+    candidate_squares: float
+    baseline_squares: float
+    difference_squares: float
+
+    def __init__(self) -> None:
+        self.pairs = 0
+        self.candidate_total = 0.0
+        self.baseline_total = 0.0
+        self.candidate_squares = 0.0
+        self.baseline_squares = 0.0
+        self.difference_squares = 0.0
+
+    def record(self, candidate: float, baseline: float) -> None:
+        self.pairs += 1
+        self.candidate_total += candidate
+        self.baseline_total += baseline
+        self.candidate_squares += candidate**2
+        self.baseline_squares += baseline**2
+        self.difference_squares += (candidate - baseline) ** 2
+
+    def merge(self, other: "Comparison") -> "Comparison":
+        self.pairs += other.pairs
+        self.candidate_total += other.candidate_total
+        self.baseline_total += other.baseline_total
+        self.candidate_squares += other.candidate_squares
+        self.baseline_squares += other.baseline_squares
+        self.difference_squares += other.difference_squares
+        return self
+
+    def _variance(self, total: float, squares: float) -> float:
+        if self.pairs < 2:
+            return 0.0
+        return (squares - total**2 / self.pairs) / (self.pairs - 1)
+
+    @property
+    def candidate_win_rate(self) -> float:
+        return self.candidate_total / self.pairs if self.pairs else 0.0
+
+    @property
+    def baseline_win_rate(self) -> float:
+        return self.baseline_total / self.pairs if self.pairs else 0.0
+
+    @property
+    def difference(self) -> float:
+        return self.candidate_win_rate - self.baseline_win_rate
+
+    @property
+    def paired_variance(self) -> float:
+        """Variance of `difference` as estimated from the paired games."""
+        if not self.pairs:
+            return 0.0
+        return (
+            self._variance(
+                self.candidate_total - self.baseline_total, self.difference_squares
+            )
+            / self.pairs
+        )
+
+    @property
+    def independent_variance(self) -> float:
+        """Variance `difference` would have had with independently shuffled games."""
+        if not self.pairs:
+            return 0.0
+        return (
+            self._variance(self.candidate_total, self.candidate_squares)
+            + self._variance(self.baseline_total, self.baseline_squares)
+        ) / self.pairs
+
+    @property
+    def variance_reduction(self) -> float:
+        """How many independent games each paired game is worth."""
+        if not self.paired_variance:
+            return float("inf") if self.independent_variance else 1.0
+        return self.independent_variance / self.paired_variance
+
+    def view(self) -> str:
+        return (
+            f"Pairs: {self.pairs}\n"
+            f"Candidate win rate: {self.candidate_win_rate:.4f}\n"
+            f"Baseline win rate: {self.baseline_win_rate:.4f}\n"
+            f"Difference: {self.difference:+.4f} "
+            f"(std. error {self.paired_variance ** 0.5:.4f})\n"
+            f"Variance reduction: {self.variance_reduction:.2f}x"
+        )
+
+    def __str__(self) -> str:
+        return self.view()
+
+
+class GamePool:  # pylint: disable=too-few-public-methods
+    """Keeps one game per seating and resets it for each new game."""
+
+    kingdom_card_set: CardTypes
+    common_random_numbers: bool
+    metrics: t.Optional[TurnMetrics]
+    games: t.Dict[Seating, Game]
+
+    def __init__(
+        self,
+        kingdom_card_set: CardTypes,
+        common_random_numbers: bool = False,
+        metrics: t.Optional[TurnMetrics] = None,
+    ) -> None:
+        self.kingdom_card_set = kingdom_card_set
+        self.common_random_numbers = common_random_numbers
+        self.metrics = metrics
+        self.games = {}
+
+    def game(self, players: PlayerTypes, seed: t.Optional[int]) -> Game:
+        """A game between `players` that plays like a new one built with `seed`."""
+        seating = tuple(players)
+        game = self.games.get(seating)
+        if game is None:
+            game = self.games[seating] = Game(
+                players,
+                self.kingdom_card_set,
+                seed=seed,
+                common_random_numbers=self.common_random_numbers,
+                metrics=self.metrics,
+            )
+        else:
+            game.reset(seed)
+        return game
+
+
+def game_seed(base_seed: t.Optional[int], game_index: int) -> t.Optional[int]:
+    """The seed game number `game_index` of a tournament seeded with `base_seed` uses."""
+    if base_seed is None:
+        return None
+    return derive_seed(base_seed, game_index)
+
+
+def seat_rotations(players: PlayerTypes) -> t.List[PlayerTypes]:
+    """Every cyclic seating of `players`, starting with the given order."""
+    return [players[seat:] + players[:seat] for seat in range(len(players))]
+
+
+def play_games(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    players: PlayerTypes,
+    kingdom_card_set: CardTypes,
+    games: range,
+    seed: t.Optional[int] = None,
+    rotate_seats: bool = False,
+    store: t.Optional[ResultStore] = None,
+    turn_metrics: bool = False,
+    stop: t.Optional[SequentialTest] = None,
+) -> TournamentResult:
+    """
+    Plays the games numbered by `games` serially in the current process, and
+    appends their summaries to `store` if given.
+
+    Stops early once the `stop` test settles on the games played so far.
+    """
+    result = TournamentResult(players)
+    if turn_metrics:
+        result.metrics = TurnMetrics()
+    summaries = []
+    seatings = seat_rotations(players) if rotate_seats else [players]
+    # One game per seating, reset for every game rather than rebuilt.
+    pool = GamePool(
+        kingdom_card_set, common_random_numbers=rotate_seats, metrics=result.metrics
+    )
+    for game_index in games:
+        seed_of_game = game_seed(seed, game_index)
+        if rotate_seats and seed_of_game is None:
+            seed_of_game = int.from_bytes(os.urandom(8), "little")
+        for seating in seatings:
+            report = pool.game(seating, seed_of_game).play()
+            result.record(report)
+            if store is not None:
+                summaries.append(report.summary)
+        if (
+            stop is not None
+            and result.statistics is not None
+            and stop.settled(result.statistics)
+        ):
+            break
+    if store is not None:
+        store.append(summaries)
+    return result
+
+
+def play_pairs(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    candidate: t.Type[Player],
+    baseline: t.Type[Player],
+    opponents: PlayerTypes,
+    kingdom_card_set: CardTypes,
+    games: range,
+    seed: int = 0,
+) -> Comparison:
+    """Plays the candidate and the baseline in seat 0 with common random numbers."""
+    comparison = Comparison()
+    pool = GamePool(kingdom_card_set, common_random_numbers=True)
+    for game_index in games:
+        candidate_share, baseline_share = (
+            report.summary.win_share(0)
+            for report in (
+                pool.game([player, *opponents], game_seed(seed, game_index)).play()
+                for player in (candidate, baseline)
+            )
+        )
+        comparison.record(candidate_share, baseline_share)
+    return comparison
+
+
+def chunk_ranges(n_games: int, chunk_size: int) -> t.Iterator[range]:
+    for start in range(0, n_games, chunk_size):
+        yield range(start, min(start + chunk_size, n_games))
+
+
+Partial = t.TypeVar("Partial", TournamentResult, Comparison)
+
+
+def worker_count(workers: t.Optional[int]) -> int:
+    """The number of processes to play with, one per core by default."""
+    if workers is None:
+        return os.cpu_count() or 1
+    return workers
+
+
+def map_chunks(
+    play: t.Callable[[range], Partial],
+    n_games: int,
+    workers: t.Optional[int],
+    chunk_size: t.Optional[int],
+) -> t.Generator[Partial, None, None]:
+    """
+    Yields the partial results of `play` over consecutive chunks of game numbers.
+
+    Chunks are spread over a pool of `workers` processes (one per core by default),
+    so each worker only reports back once per chunk.
+    With a single worker the games are played in the current process.
+    Results arrive in chunk order; closing the iterator early cancels the chunks
+    that have not started yet.
+    """
+    workers = worker_count(workers)
+    if workers <= 1 or n_games <= 1:
+        for chunk in chunk_ranges(n_games, chunk_size or max(1, n_games)):
+            yield play(chunk)
+        return
+    if chunk_size is None:
+        # A few chunks per worker keeps the pool busy when chunks finish unevenly.
+        chunk_size = max(1, n_games // (workers * 4))
+    chunks = chunk_ranges(n_games, chunk_size)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        # Only keep a couple of chunks queued per worker so stopping is cheap.
+        pending = collections.deque(
+            executor.submit(play, chunk)
+            for chunk in itertools.islice(chunks, workers * 2)
+        )
+        try:
+            while pending:
+                partial = pending.popleft().result()
+                for chunk in itertools.islice(chunks, 1):
+                    pending.append(executor.submit(play, chunk))
+                yield partial
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def run(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    players: PlayerTypes,
+    kingdom_card_set: CardTypes,
+    n_games: int,
+    workers: t.Optional[int] = None,
+    chunk_size: t.Optional[int] = None,
+    seed: t.Optional[int] = None,
+    rotate_seats: bool = False,
+    stop: t.Optional[SequentialTest] = None,
+    store: t.Optional[ResultStore] = None,
+    turn_metrics: bool = False,
+) -> TournamentResult:
+    """
+    Plays `n_games` games, in parallel if `workers` allows, and returns the merged
+    win tallies.
+
+    With `rotate_seats` every game is played once in each cyclic seating of
+    `players`, each seat keeping the same shuffle stream across the rotations,
+    so first-player advantage and the luck of the draw cancel out between bots.
+    Results are kept per seating as well as combined.
+
+    Given a `seed`, game `i` is seeded with `game_seed(seed, i)` whatever worker
+    plays it, so the whole run is reproducible and any single game can be replayed
+    with `Game(players, kingdom_card_set, seed=game_seed(seed, i))`.
+
+    A `stop` test is checked against the head-to-head record of the first two
+    distinct bots after every game when playing serially, or after every chunk
+    otherwise, and the run ends as soon as it settles, naming the significantly
+    better bot in `decision` or finding none. A run that reaches `n_games` first
+    ends without a decision.
+
+    Given a `store`, every worker appends the summaries of the games it played
+    once per chunk. Played serially with a `stop` test, all games are one chunk.
+
+    With `turn_metrics` the result also gets the per-turn `TurnMetrics` of every
+    bot, merged over all games.
+    """
+    players = list(players)
+    if stop is not None and len(set(players)) < 2:
+        raise ValueError("Early stopping needs at least two different bots.")
+    serial = worker_count(workers) <= 1
+    # Played serially, all games are one chunk that checks the test after each, so
+    # they share one game pool and the store is appended to once.
+    if stop is not None and serial:
+        chunk_size = None
+    play = functools.partial(
+        play_games,
+        players,
+        list(kingdom_card_set),
+        seed=seed,
+        rotate_seats=rotate_seats,
+        store=store,
+        turn_metrics=turn_metrics,
+        stop=stop if serial else None,
+    )
+    result = TournamentResult(players)
+    result.planned_games = n_games * (len(players) if rotate_seats else 1)
+    partials = map_chunks(play, n_games, workers, chunk_size)
+    for partial in partials:
+        result.merge(partial)
+        if stop is not None and result.statistics is not None:
+            if stop.settled(result.statistics):
+                result.stopped = True
+                result.decision = stop.decision(result.statistics)
+                break
+    partials.close()
+    return result
+
+
+def compare(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    candidate: t.Type[Player],
+    baseline: t.Type[Player],
+    opponents: PlayerTypes,
+    kingdom_card_set: CardTypes,
+    n_games: int,
+    workers: t.Optional[int] = None,
+    chunk_size: t.Optional[int] = None,
+    seed: int = 0,
+) -> Comparison:
+    """
+    Compares two bots using common random numbers.
+
+    For each of the `n_games` seeds the candidate and the baseline each play one game
+    from seat 0 against `opponents`, with every seat shuffling from its own stream,
+    so both games deal the same shuffles and differ only by the strategy in seat 0.
+    """
+    play = functools.partial(
+        play_pairs,
+        candidate,
+        baseline,
+        list(opponents),
+        list(kingdom_card_set),
+        seed=seed,
+    )
+    comparison = Comparison()
+    for partial in map_chunks(play, n_games, workers, chunk_size):
+        comparison.merge(partial)
+    return comparison
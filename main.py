@@ -1,5 +1,5 @@
 from bots.bigmoney import BigMoney, BigMoneySmithy
-from dominion import Game
+from dominion import tournament
 from dominion.cards.expansions import first_edition as fe
 
 kingdom = [
@@ -15,13 +15,8 @@ kingdom = [
     fe.Feast,
 ]
 
-scores = {BigMoney: 0, BigMoneySmithy: 0}
+if __name__ == "__main__":
+    result = tournament.run([BigMoney, BigMoneySmithy], kingdom, 10000)
+    print("Done")
 
-for i in range(10000):
-    print("Game:", i)
-    report = Game(scores, kingdom).play()
-    for winner in report.winners:
-        scores[winner[0].__class__] += 1
-print("Done")
-
-print(scores)
+    print(result.wins)
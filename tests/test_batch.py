@@ -0,0 +1,67 @@
+import math
+
+import pytest
+
+from dominion import tournament
+from dominion.cards.expansions import first_edition as fe
+from dominion.cards.treasure import Gold, Silver
+from dominion.cards.victory import Duchy, Province
+from dominion.rules import BuyRule, CountBelow, PileBelow, RuleBot
+
+pytest.importorskip("numpy")
+batch = pytest.importorskip("dominion.batch")
+
+KINGDOM = [
+    fe.Cellar,
+    fe.Moat,
+    fe.Village,
+    fe.Smithy,
+    fe.Workshop,
+    fe.Remodel,
+    fe.Chapel,
+    fe.Festival,
+    fe.Market,
+    fe.Laboratory,
+]
+
+
+class MoneyBot(RuleBot):
+    buy_rules = [
+        BuyRule(Province, 8),
+        BuyRule(Duchy, 5, PileBelow(Province, 4)),
+        BuyRule(Gold, 6),
+        BuyRule(Silver, 3),
+    ]
+
+
+class SmithyBot(RuleBot):
+    buy_rules = [
+        BuyRule(Province, 8),
+        BuyRule(Duchy, 5, PileBelow(Province, 4)),
+        BuyRule(Gold, 6),
+        BuyRule(fe.Smithy, 4, CountBelow(fe.Smithy, 1)),
+        BuyRule(Silver, 3),
+    ]
+    play_priority = [fe.Smithy]
+
+
+def win_rate(result: tournament.TournamentResult) -> float:
+    return result.wins[MoneyBot] / result.games
+
+
+def test_batch_engine_agrees_with_games():
+    players = [MoneyBot, SmithyBot]
+    games = tournament.run(players, KINGDOM, 1000, workers=1, seed=1)
+    batched = batch.run(players, KINGDOM, 4000, seed=1)
+
+    # Ties count as a win for both bots, so the rates are compared as proportions
+    # with a generous z of 4, the seeds keep the test deterministic.
+    rate, batch_rate = win_rate(games), win_rate(batched)
+    error = math.sqrt(
+        rate * (1 - rate) / games.games + batch_rate * (1 - batch_rate) / batched.games
+    )
+    assert abs(rate - batch_rate) < 4 * error
+
+    margins, batch_margins = games.statistics.margins, batched.statistics.margins
+    error = math.hypot(margins.standard_error, batch_margins.standard_error)
+    assert abs(margins.mean - batch_margins.mean) < 4 * error
@@ -0,0 +1,41 @@
+from bots.bigmoney import BigMoney, BigMoneySmithy
+from dominion import tournament
+from dominion.cards.expansions import first_edition as fe
+from dominion.metrics import MEASURES
+
+
+class Unseen(BigMoney):
+    pass
+
+
+def metrics(workers):
+    result = tournament.run(
+        [BigMoney, BigMoneySmithy],
+        [fe.Smithy],
+        200,
+        workers=workers,
+        chunk_size=25,
+        seed=7,
+        turn_metrics=True,
+    )
+    return result.metrics
+
+
+def test_metrics_do_not_depend_on_workers():
+    serial, parallel = metrics(1), metrics(4)
+    assert serial.curve(BigMoney, "points")
+    for bot in (BigMoney, BigMoneySmithy):
+        for measure in MEASURES:
+            for quantile in (None, 0.1, 0.5, 0.9):
+                assert serial.curve(bot, measure.name, quantile) == parallel.curve(
+                    bot, measure.name, quantile
+                )
+    assert serial.view() == parallel.view()
+
+
+def test_reading_an_unseen_bot_leaves_the_metrics_alone():
+    turn_metrics = metrics(1)
+    view = turn_metrics.view()
+    assert turn_metrics.curve(Unseen, "points") == []
+    assert Unseen not in turn_metrics.bots
+    assert turn_metrics.view() == view
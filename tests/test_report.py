@@ -0,0 +1,29 @@
+import io
+import pickle
+
+from bots.bigmoney import BigMoney, BigMoneySmithy
+from dominion.cards.expansions import first_edition as fe
+from dominion.game import Game
+from dominion.report import Report
+
+
+def test_decks_are_listed_in_order_of_appearance():
+    game = Game([BigMoney, BigMoneySmithy], [fe.Smithy], game_output=io.StringIO())
+    report = game.play()
+    for player in game.players:
+        deck = Report.player_deck(player)
+        assert list(report.final_deck(player).items()) == list(deck.items())
+        assert ", ".join(f"{card.name}: {count}" for card, count in deck.items()) in (
+            report.view()
+        )
+
+
+def test_final_decks_outlive_the_game():
+    game = Game([BigMoney, BigMoneySmithy], [fe.Smithy], game_output=io.StringIO())
+    report = game.play()
+    final = {player: Report.player_deck(player) for player in game.players}
+    view = report.view()
+    game.reset(1)
+    for player, deck in final.items():
+        assert report.final_deck(player) == deck
+    assert pickle.loads(pickle.dumps(report)).view() == view
@@ -0,0 +1,29 @@
+import io
+
+from bots.bigmoney import BigMoney
+from dominion.cards.card import KingdomCard
+from dominion.cards.registry import VARIABLE_POINTS
+from dominion.cards.victory import Duchy, Victory
+from dominion.game import Game
+
+
+class Duke(Victory, KingdomCard):
+    name: str = "Duke"
+    cost: int = 5
+
+    @classmethod
+    def points(cls, deck) -> int:
+        return deck.count(Duchy)
+
+
+def test_overriding_points_rescores_the_card():
+    assert Duke.type_flags & VARIABLE_POINTS
+    assert not Duchy.type_flags & VARIABLE_POINTS
+    game = Game([BigMoney, BigMoney], [Duke], game_output=io.StringIO(), seed=0)
+    deck = game.players[0].deck
+    for card in [Duchy, Duchy, Duchy, Duke]:
+        deck.gain(card)
+    # 3 Estates, 3 Duchies and a Duke worth one point per Duchy.
+    assert deck.score == 3 + 9 + 3
+    deck.gain(Duchy)
+    assert deck.score == 3 + 12 + 4
@@ -0,0 +1,75 @@
+import builtins
+import io
+import sys
+
+from dominion.cards.action import Action
+from dominion.cards.expansions import first_edition as fe
+from dominion.cards.treasure import Gold, Silver
+from dominion.cards.victory import Province
+from dominion.game import Game
+from dominion.rules import BuyRule, CountBelow, RuleBot
+
+KINGDOM = [
+    fe.Cellar,
+    fe.Moat,
+    fe.Village,
+    fe.Smithy,
+    fe.Workshop,
+    fe.Remodel,
+    fe.Chapel,
+    fe.Festival,
+    fe.Market,
+    fe.Laboratory,
+]
+
+
+class SmithyBot(RuleBot):
+    buy_rules = [
+        BuyRule(Province, 8),
+        BuyRule(Gold, 6),
+        BuyRule(fe.Smithy, 4, CountBelow(fe.Smithy, 2)),
+        BuyRule(Silver, 3),
+    ]
+    play_priority = [fe.Smithy]
+
+
+class MarketBot(RuleBot):
+    buy_rules = [
+        BuyRule(Province, 8),
+        BuyRule(Gold, 6),
+        BuyRule(fe.Market, 5),
+        BuyRule(fe.Village, 3, CountBelow(fe.Village, 2)),
+        BuyRule(Silver, 3),
+    ]
+    play_priority = [fe.Village, fe.Market]
+
+
+class NoOutput(io.TextIOBase):
+    """A stream that fails the test on any write."""
+
+    def write(self, text: str) -> int:
+        raise AssertionError(f"A silent game wrote {text!r}")
+
+
+def no_open(*args, **kwargs):
+    raise AssertionError(f"A silent game opened {args!r}")
+
+
+def test_silent_games_perform_no_io(monkeypatch):
+    played = []
+    play = Action.play.__func__
+
+    def spy(cls, deck):
+        played.append(cls)
+        play(cls, deck)
+
+    monkeypatch.setattr(Action, "play", classmethod(spy))
+    stream = NoOutput()
+    monkeypatch.setattr(sys, "stdout", stream)
+    monkeypatch.setattr(sys, "stderr", stream)
+    monkeypatch.setattr(builtins, "open", no_open)
+    for seed in range(50):
+        Game([SmithyBot, MarketBot], KINGDOM, game_output=stream, seed=seed).play()
+    monkeypatch.undo()
+    assert fe.Smithy in played
+    assert fe.Market in played
@@ -0,0 +1,89 @@
+import io
+
+import pytest
+
+from bots.bigmoney import BigMoney
+from dominion.cards.expansions import first_edition as fe
+from dominion.cards.registry import CURSE, VICTORY, registry
+from dominion.cards.treasure import Gold, Silver
+from dominion.cards.victory import Province
+from dominion.deck import Deck
+from dominion.game import Game
+from dominion.rules import BuyRule, CountBelow
+
+
+class AttackBot(BigMoney):
+    buy_rules = [
+        BuyRule(Province, 8),
+        BuyRule(Gold, 6),
+        BuyRule(fe.Militia, 4, CountBelow(fe.Militia, 2)),
+        BuyRule(fe.Moat, 2, CountBelow(fe.Moat, 2)),
+        BuyRule(Silver, 3),
+    ]
+    play_priority = [fe.Militia, fe.Moat]
+
+
+class GardensBot(BigMoney):
+    buy_rules = [
+        BuyRule(Province, 8),
+        BuyRule(Gold, 6),
+        BuyRule(fe.Gardens, 4),
+        BuyRule(Silver, 3),
+    ]
+
+
+class GenericGame(Game):
+    """A game that always dispatches events, as if any card could react."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.reactive = self.reacts_to_draws = True
+        # Deal again so the opening hands go through the reaction registry too.
+        self.reset(self.seed)
+
+
+def generic_score(deck: Deck) -> int:
+    """Asks every Victory and Curse card in the deck for its points."""
+    return sum(
+        count * registry[card_id].points(deck)
+        for card_id, count in enumerate(deck.deck_counts)
+        if count and registry[card_id].type_flags & (VICTORY | CURSE)
+    )
+
+
+def played(game_class, kingdom, seed):
+    report = game_class(
+        [AttackBot, GardensBot], kingdom, game_output=io.StringIO(), seed=seed
+    ).play()
+    return report.view(), report.summary.scores, report.summary.decks
+
+
+@pytest.mark.parametrize(
+    "kingdom",
+    [[fe.Moat, fe.Militia], [fe.Militia], [fe.Moat], [fe.Gardens], [fe.Smithy]],
+    ids=["moat-militia", "militia", "moat", "gardens", "vanilla"],
+)
+def test_specialized_games_play_like_generic_ones(monkeypatch, kingdom):
+    specialized = [played(Game, kingdom, seed) for seed in range(20)]
+    monkeypatch.setattr(Deck, "score", property(generic_score))
+    generic = [played(GenericGame, kingdom, seed) for seed in range(20)]
+    assert specialized == generic
+
+
+def test_only_games_with_reactions_to_attacks_are_reactive():
+    reactive = {
+        name: (game.reactive, game.reacts_to_draws)
+        for name, game in (
+            (name, Game([AttackBot, GardensBot], kingdom, game_output=io.StringIO()))
+            for name, kingdom in (
+                ("moat-militia", [fe.Moat, fe.Militia]),
+                ("militia", [fe.Militia]),
+                ("moat", [fe.Moat]),
+            )
+        )
+    }
+    assert reactive == {
+        "moat-militia": (True, False),
+        "militia": (False, False),
+        "moat": (False, False),
+    }
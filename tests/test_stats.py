@@ -0,0 +1,72 @@
+import random
+
+from bots.bigmoney import BigMoney
+from dominion import tournament
+from dominion.cards.expansions import first_edition as fe
+from dominion.stats import MatchStatistics, SequentialTest
+
+
+class Left(BigMoney):
+    pass
+
+
+class Right(BigMoney):
+    pass
+
+
+def settle(test, win_probability, rng):
+    """Feeds `test` decisive games won by `first` with `win_probability`."""
+    statistics = MatchStatistics(Left, Right)
+    while not test.settled(statistics):
+        if rng.random() < win_probability:
+            statistics.wins += 1
+        else:
+            statistics.losses += 1
+    return test.decision(statistics)
+
+
+def test_evenly_matched_bots_are_rarely_separated():
+    test, rng = SequentialTest(alpha=0.05), random.Random(0)
+    runs = 400
+    winners = sum(settle(test, 0.5, rng) is not None for _ in range(runs))
+    # alpha plus two standard errors.
+    assert winners / runs < 0.05 + 2 * (0.05 * 0.95 / runs) ** 0.5
+
+
+def test_a_better_bot_is_found():
+    test, rng = SequentialTest(alpha=0.05, beta=0.1, delta=0.05), random.Random(0)
+    runs = 200
+    decisions = [settle(test, 0.55, rng) for _ in range(runs)]
+    assert decisions.count(Right) == 0
+    assert decisions.count(Left) / runs > 0.8
+
+
+def test_identical_bots_stop_without_a_winner():
+    result = tournament.run(
+        [Left, Right], [fe.Smithy], 5000, workers=1, seed=1, stop=SequentialTest()
+    )
+    assert result.stopped
+    assert result.decision is None
+    assert result.games_saved > 0
+    assert "no significant difference" in result.view()
+
+
+def test_early_stopping_reuses_one_game(monkeypatch):
+    built = []
+
+    class CountedGame(tournament.Game):
+        def __init__(self, *args, **kwargs):
+            built.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(tournament, "Game", CountedGame)
+    result = tournament.run(
+        [Left, Right],
+        [fe.Smithy],
+        5000,
+        workers=1,
+        seed=1,
+        stop=SequentialTest(),
+    )
+    assert result.stopped
+    assert len(built) == 1
@@ -0,0 +1,49 @@
+import io
+import json
+
+import pytest
+
+from bots.bigmoney import BigMoney, BigMoneySmithy
+from dominion.cards.expansions import first_edition as fe
+from dominion.cards.treasure import Copper, Silver
+from dominion.game import Game
+
+pytest.importorskip("numpy")
+store = pytest.importorskip("dominion.store")
+analysis = pytest.importorskip("dominion.analysis")
+
+
+def play(seed):
+    players = [BigMoney, BigMoneySmithy]
+    return Game(players, [fe.Smithy], game_output=io.StringIO(), seed=seed).play()
+
+
+def test_cards_are_stored_by_name(tmp_path):
+    results = store.ResultStore(str(tmp_path))
+    # As if another process had defined Silver before Copper.
+    schema_path = tmp_path / "schema.json"
+    schema = json.loads(schema_path.read_text())
+    cards = schema["cards"]
+    copper, silver = cards.index(results.cards[0]), results.card_id(Silver)
+    cards[copper], cards[silver] = cards[silver], cards[copper]
+    schema_path.write_text(json.dumps(schema))
+
+    summaries = [play(seed).summary for seed in range(3)]
+    results.append(summaries)
+    stored = analysis.Results.from_store(results)
+    for card in (Copper, Silver, fe.Smithy):
+        expected = [
+            summary.deck(seat).get(card, 0) for summary in summaries for seat in (0, 1)
+        ]
+        assert stored.deck_count(card).tolist() == expected
+    assert stored.in_kingdom(fe.Smithy).all()
+
+
+def test_out_of_range_seeds_are_refused(tmp_path):
+    results = store.ResultStore(str(tmp_path))
+    for seed in (-5, 2**70):
+        with pytest.raises(ValueError):
+            results.append([play(seed).summary])
+    results.append([play(2**64 - 1).summary])
+    assert results.column("seed")[0] == 2**64 - 1
+    assert len(results) == 1
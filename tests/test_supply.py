@@ -0,0 +1,27 @@
+import io
+
+from dominion.cards.curse import Curse
+from dominion.cards.expansions import first_edition as fe
+from dominion.cards.treasure import Gold, Silver
+from dominion.cards.victory import Province
+from dominion.game import Game
+from dominion.rules import BuyRule, CountBelow, RuleBot
+
+
+class WitchBot(RuleBot):
+    buy_rules = [
+        BuyRule(Province, 8),
+        BuyRule(Gold, 6),
+        BuyRule(fe.Witch, 5, CountBelow(fe.Witch, 2)),
+        BuyRule(Silver, 3),
+    ]
+    play_priority = [fe.Witch]
+
+
+def test_gained_curses_leave_the_supply():
+    game = Game([WitchBot, WitchBot], [fe.Witch], game_output=io.StringIO(), seed=3)
+    curses = game.supply[Curse]
+    summary = game.play().summary
+    gained = summary.deck(0).get(Curse, 0) + summary.deck(1).get(Curse, 0)
+    assert gained > 0
+    assert game.supply[Curse] == curses - gained